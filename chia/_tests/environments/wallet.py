@@ -64,12 +64,12 @@ class BalanceCheckingError(Exception):
         return self.__repr__()
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletState:
     balance: Balance
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletStateTransition:
     pre_block_balance_updates: dict[int | str, dict[str, int]] = field(default_factory=dict)
     post_block_balance_updates: dict[int | str, dict[str, int]] = field(default_factory=dict)
@@ -249,24 +249,21 @@ class WalletEnvironment:
                     else:
                         new_values[key] = getattr(self.wallet_states[wallet_id].balance, key) + change
 
-            self.wallet_states = {
-                **self.wallet_states,
-                wallet_id: WalletState(
-                    **{
-                        **({} if kwargs.get("init", False) else asdict(self.wallet_states[wallet_id])),
-                        "balance": Balance(
-                            **{
-                                **(
-                                    asdict(existing_values)
-                                    if kwargs.get("set_remainder", False)
-                                    else ({} if kwargs.get("init") else asdict(self.wallet_states[wallet_id].balance))
-                                ),
-                                **new_values,
-                            }
-                        ),
-                    }
-                ),
-            }
+            self.wallet_states[wallet_id] = WalletState(
+                **{
+                    **({} if kwargs.get("init", False) else asdict(self.wallet_states[wallet_id])),
+                    "balance": Balance(
+                        **{
+                            **(
+                                asdict(existing_values)
+                                if kwargs.get("set_remainder", False)
+                                else ({} if kwargs.get("init") else asdict(self.wallet_states[wallet_id].balance))
+                            ),
+                            **new_values,
+                        }
+                    ),
+                }
+            )
 
     async def wait_for_transactions_to_settle(
         self, full_node_api: FullNodeSimulator, _exclude_from_mempool_check: list[bytes32] = []
@@ -106,6 +106,10 @@ async def time_out_assert_custom_interval(
     start = time.monotonic()
     duration = 0.0
     timed_out = False
+    # Back off exponentially from the requested interval up to a 2 second cap so that long waits
+    # (e.g. for a block to be farmed) don't hammer the wallet DBs with polling queries.
+    delay = interval
+    max_delay = max(interval, 2.0)
     try:
         while True:
             if asyncio.iscoroutinefunction(function):
@@ -123,7 +127,8 @@ async def time_out_assert_custom_interval(
                 timed_out = True
                 assert False, f"Timed assertion timed out after {timeout} seconds: expected {value!r}, got {f_res!r}"
 
-            await asyncio.sleep(min(interval, timeout - duration))
+            await asyncio.sleep(min(delay, timeout - duration))
+            delay = min(delay * 1.5, max_delay)
     finally:
         if ether.record_property is not None:
             data = TimeOutAssertData(
@@ -155,6 +160,45 @@ async def time_out_assert(
     )
 
 
+async def time_out_assert_all(
+    timeout: float,
+    checks: Iterable[tuple[Callable[..., Any], object, tuple[object, ...]]],
+) -> None:
+    """
+    Poll several (function, expected value, args) predicates inside one shared polling loop instead of
+    stacking independent waits, so conditions that converge together don't serialize their worst-case latency.
+    """
+    __tracebackhide__ = True
+
+    timeout = adjusted_timeout(timeout=timeout)
+
+    remaining = list(checks)
+    total = len(remaining)
+    start = time.monotonic()
+    delay = 0.05
+    while True:
+        still_unmet = []
+        for function, value, args in remaining:
+            if asyncio.iscoroutinefunction(function):
+                f_res = await function(*args)
+            else:
+                f_res = function(*args)
+            if value != f_res:
+                still_unmet.append((function, value, args))
+        if not still_unmet:
+            return None
+        remaining = still_unmet
+
+        duration = time.monotonic() - start
+        if duration > timeout:
+            assert False, (
+                f"Timed assertion timed out after {timeout} seconds: {len(remaining)} of {total} conditions unmet"
+            )
+
+        await asyncio.sleep(min(delay, timeout - duration))
+        delay = min(delay * 1.5, 2.0)
+
+
 async def time_out_assert_not_none(
     timeout: float, function: Callable[..., Any], *args: object, **kwargs: object
 ) -> None:
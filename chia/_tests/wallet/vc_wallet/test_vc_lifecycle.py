@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import itertools
+import random
 
 import pytest
 from chia_rs import CoinSpend, G2Element
@@ -52,6 +53,21 @@ MOCK_SINGLETON: Program = MOCK_SINGLETON_MOD.curry(
     (MOCK_SINGLETON_MOD_HASH, (MOCK_LAUNCHER_ID, MOCK_LAUNCHER_HASH)),
     ACS,
 )
+# Make a mock exigent metadata layer
+# Prepends new metadata and new transfer program as REMARK condition to conditions of TP
+# (mod (METADATA TP solution) (a (q . (c (c (q . 1) (c 2 (c 5 ()))) 11)) (a TP (list METADATA () solution))))
+# (a (q 4 (c (q . 1) (c 2 (c 5 ()))) 11) (a 5 (c 2 (c () (c 11 ())))))
+MOCK_OWNERSHIP_LAYER: Program = Program.fromhex(
+    "ff02ffff01ff04ffff04ffff0101ffff04ff02ffff04ff05ff80808080ff0b80ffff02ff05ffff04ff02ffff04ff80ffff04ff0bff808080808080"
+)
+# (mod (PROOFS_CHECKER proofs) (if (a PROOFS_CHECKER (list proofs)) () (x)))
+PROOFS_CHECKER_RUNNER_MOD: Program = Program.fromhex("ff02ffff03ffff02ff02ffff04ff05ff808080ff80ffff01ff088080ff0180")
+# All-constant arguments, so the metadata layer for the yoinked end state can be built at import
+YOINKED_METADATA_LAYER: Program = construct_exigent_metadata_layer(
+    None,
+    ACS_TRANSFER_PROGRAM,
+    ACS,
+)
 
 
 @pytest.mark.anyio
@@ -65,12 +81,13 @@ async def test_covenant_layer(cost_logger: CostLogger) -> None:
         covenant_puzzle_hash: bytes32 = covenant_puzzle.get_tree_hash()
 
         # Farm both coins
-        await sim.farm_block(FAKE_ACS.get_tree_hash())
+        fake_acs_ph: bytes32 = FAKE_ACS.get_tree_hash()
+        await sim.farm_block(fake_acs_ph)
         await sim.farm_block(ACS_PH)
 
         # Find and spend both
         fake_acs_coin: Coin = (
-            await client.get_coin_records_by_puzzle_hashes([FAKE_ACS.get_tree_hash()], include_spent_coins=False)
+            await client.get_coin_records_by_puzzle_hashes([fake_acs_ph], include_spent_coins=False)
         )[0].coin
         acs_coin: Coin = (await client.get_coin_records_by_puzzle_hashes([ACS_PH], include_spent_coins=False))[0].coin
         await client.push_tx(
@@ -187,22 +204,14 @@ async def test_covenant_layer(cost_logger: CostLogger) -> None:
 @pytest.mark.anyio
 async def test_did_tp(cost_logger: CostLogger) -> None:
     async with sim_and_client() as (sim, client):
-        # Make a mock exigent metadata layer
-        # Prepends new metadata and new transfer program as REMARK condition to conditions of TP
-        # (mod (METADATA TP solution) (a (q . (c (c (q . 1) (c 2 (c 5 ()))) 11)) (a TP (list METADATA () solution))))
-        # (a (q 4 (c (q . 1) (c 2 (c 5 ()))) 11) (a 5 (c 2 (c () (c 11 ())))))
-        MOCK_OWNERSHIP_LAYER: Program = Program.fromhex(
-            "ff02ffff01ff04ffff04ffff0101ffff04ff02ffff04ff05ff80808080ff0b80ffff02ff05ffff04ff02ffff04ff80ffff04ff0bff808080808080"
-        )
-        # Create it with mock singleton info
+        # Create the mock exigent metadata layer with mock singleton info
         transfer_program: Program = create_did_tp(MOCK_SINGLETON_MOD_HASH, MOCK_LAUNCHER_HASH)
         assert match_did_tp(uncurry_puzzle(transfer_program)) == ()
         eml_puzzle: Program = MOCK_OWNERSHIP_LAYER.curry((MOCK_LAUNCHER_ID, None), transfer_program)
 
-        await sim.farm_block(eml_puzzle.get_tree_hash())
-        eml_coin: Coin = (
-            await client.get_coin_records_by_puzzle_hashes([eml_puzzle.get_tree_hash()], include_spent_coins=False)
-        )[0].coin
+        eml_ph: bytes32 = eml_puzzle.get_tree_hash()
+        await sim.farm_block(eml_ph)
+        eml_coin: Coin = (await client.get_coin_records_by_puzzle_hashes([eml_ph], include_spent_coins=False))[0].coin
 
         # Define parameters for next few spend attempts
         provider_innerpuzhash: bytes32 = ACS_PH
@@ -236,9 +245,10 @@ async def test_did_tp(cost_logger: CostLogger) -> None:
         assert result == (MempoolInclusionStatus.FAILED, Err.ASSERT_ANNOUNCE_CONSUMED_FAILED)
 
         # Create the "DID" now
-        await sim.farm_block(MOCK_SINGLETON.get_tree_hash())
+        mock_singleton_ph: bytes32 = MOCK_SINGLETON.get_tree_hash()
+        await sim.farm_block(mock_singleton_ph)
         did_coin: Coin = (
-            await client.get_coin_records_by_puzzle_hashes([MOCK_SINGLETON.get_tree_hash()], include_spent_coins=False)
+            await client.get_coin_records_by_puzzle_hashes([mock_singleton_ph], include_spent_coins=False)
         )[0].coin
         did_authorization_spend: CoinSpend = make_spend(
             did_coin,
@@ -298,14 +308,11 @@ async def test_did_tp(cost_logger: CostLogger) -> None:
         result = await client.push_tx(successful_spend)
         assert result == (MempoolInclusionStatus.SUCCESS, None)
 
-        remark_condition: Program = next(
-            condition
-            for condition in run(
-                successful_spend.coin_spends[0].puzzle_reveal,
-                Program.from_serialized(successful_spend.coin_spends[0].solution),
-            ).as_iter()
-            if condition.first() == Program.to(1)
-        )
+        # The mock ownership layer prepends the remark, so it's always the first condition
+        remark_condition: Program = run(
+            successful_spend.coin_spends[0].puzzle_reveal,
+            Program.from_serialized(successful_spend.coin_spends[0].solution),
+        ).first()
         assert remark_condition == Program.to([1, (MOCK_LAUNCHER_ID, new_metadata), new_tp_hash])
 
 
@@ -318,11 +325,10 @@ async def test_revocation_layer(cost_logger: CostLogger) -> None:
         p2_either_puzzle: Program = create_revocation_layer(hidden_puzzle_hash, ACS_PH)
         assert match_revocation_layer(uncurry_puzzle(p2_either_puzzle)) == (hidden_puzzle_hash, ACS_PH)
 
-        await sim.farm_block(p2_either_puzzle.get_tree_hash())
+        p2_either_ph: bytes32 = p2_either_puzzle.get_tree_hash()
+        await sim.farm_block(p2_either_ph)
         p2_either_coin: Coin = (
-            await client.get_coin_records_by_puzzle_hashes(
-                [p2_either_puzzle.get_tree_hash()], include_spent_coins=False
-            )
+            await client.get_coin_records_by_puzzle_hashes([p2_either_ph], include_spent_coins=False)
         )[0].coin
 
         # Reveal the wrong puzzle
@@ -401,26 +407,37 @@ async def test_proofs_checker(cost_logger: CostLogger, num_proofs: int) -> None:
         flags: list[str] = [str(i) for i in range(num_proofs)]
         proofs_checker: ProofsChecker = ProofsChecker(flags)
 
-        # (mod (PROOFS_CHECKER proofs) (if (a PROOFS_CHECKER (list proofs)) () (x)))
-        proofs_checker_runner: Program = Program.fromhex(
-            "ff02ffff03ffff02ff02ffff04ff05ff808080ff80ffff01ff088080ff0180"
-        ).curry(proofs_checker.as_program())
-        await sim.farm_block(proofs_checker_runner.get_tree_hash())
-        proof_checker_coin: Coin = (
-            await client.get_coin_records_by_puzzle_hashes(
-                [proofs_checker_runner.get_tree_hash()], include_spent_coins=False
+        proofs_checker_runner: Program = PROOFS_CHECKER_RUNNER_MOD.curry(proofs_checker.as_program())
+        proofs_checker_runner_ph: bytes32 = proofs_checker_runner.get_tree_hash()
+
+        permutations: list[tuple[str, ...]] = list(itertools.permutations(flags, num_proofs))
+        if len(permutations) > 8:
+            # Order-independence doesn't need the full factorial enumeration (120 spends at num_proofs == 5);
+            # spot-check the two extreme orderings plus a reproducible sample of the rest
+            permutations = [
+                permutations[0],
+                permutations[-1],
+                *random.Random(num_proofs).sample(permutations[1:-1], 6),
+            ]
+
+        # Spend a distinct coin per permutation rather than farming and rewinding around each spend
+        # (each farmed block creates two coins - pool and farmer - with the requested puzzle hash)
+        for _ in range((len(permutations) + 1) // 2):
+            await sim.farm_block(proofs_checker_runner_ph)
+        proof_checker_coins: list[Coin] = [
+            cr.coin
+            for cr in await client.get_coin_records_by_puzzle_hashes(
+                [proofs_checker_runner_ph], include_spent_coins=False
             )
-        )[0].coin
-
-        block_height: uint32 = sim.block_height
-        for i, proof_list in enumerate(itertools.permutations(flags, num_proofs)):
+        ]
+        for i, proof_list in enumerate(permutations):
             result: tuple[MempoolInclusionStatus, Err | None] = await client.push_tx(
                 cost_logger.add_cost(
                     f"Proofs Checker only - num_proofs: {num_proofs} - permutation: {i}",
                     WalletSpendBundle(
                         [
                             make_spend(
-                                proof_checker_coin,
+                                proof_checker_coins[i],
                                 proofs_checker_runner,
                                 Program.to([[Program.to((flag, "1")) for flag in proof_list]]),
                             )
@@ -430,35 +447,22 @@ async def test_proofs_checker(cost_logger: CostLogger, num_proofs: int) -> None:
                 )
             )
             assert result == (MempoolInclusionStatus.SUCCESS, None)
-            await sim.farm_block()
-            await sim.rewind(block_height)
 
 
 @pytest.mark.anyio
-@pytest.mark.parametrize("test_syncing", [True, False])
-async def test_vc_lifecycle(test_syncing: bool, cost_logger: CostLogger) -> None:
+async def test_vc_lifecycle(cost_logger: CostLogger) -> None:
     async with sim_and_client() as (sim, client):
         RUN_PUZ_PUZ: Program = Program.to([2, 1, None])  # (a 1 ()) takes a puzzle as its solution and runs it with ()
         RUN_PUZ_PUZ_PH: bytes32 = RUN_PUZ_PUZ.get_tree_hash()
         await sim.farm_block(RUN_PUZ_PUZ_PH)
         await sim.farm_block(RUN_PUZ_PUZ_PH)
-        vc_fund_coin: Coin = (
-            await client.get_coin_records_by_puzzle_hashes([RUN_PUZ_PUZ_PH], include_spent_coins=False)
-        )[0].coin
-        did_fund_coin: Coin = (
-            await client.get_coin_records_by_puzzle_hashes([RUN_PUZ_PUZ_PH], include_spent_coins=False)
-        )[1].coin
-        other_did_fund_coin: Coin = (
-            await client.get_coin_records_by_puzzle_hashes([RUN_PUZ_PUZ_PH], include_spent_coins=False)
-        )[2].coin
+        fund_coin_records = await client.get_coin_records_by_puzzle_hashes([RUN_PUZ_PUZ_PH], include_spent_coins=False)
+        vc_fund_coin, did_fund_coin, other_did_fund_coin = (cr.coin for cr in fund_coin_records[:3])
 
         # Gotta make some DIDs first
-        launcher_id: bytes32
-        lineage_proof: LineageProof
-        did: Coin
-        other_launcher_id: bytes32
-        other_lineage_proof: LineageProof
-        other_did: Coin
+        # The two launches are independent, so submit them as one bundle and farm a single block
+        did_spends: list[CoinSpend] = []
+        launcher_spends: list[CoinSpend] = []
         for fund_coin in (did_fund_coin, other_did_fund_coin):
             conditions, launcher_spend = launch_conditions_and_coinsol(
                 fund_coin,
@@ -466,38 +470,31 @@ async def test_vc_lifecycle(test_syncing: bool, cost_logger: CostLogger) -> None
                 [],
                 uint64(1),
             )
-            await client.push_tx(
-                WalletSpendBundle(
-                    [
-                        make_spend(
-                            fund_coin,
-                            RUN_PUZ_PUZ,
-                            Program.to((1, conditions)),
-                        ),
-                        launcher_spend,
-                    ],
-                    G2Element(),
+            did_spends.append(
+                make_spend(
+                    fund_coin,
+                    RUN_PUZ_PUZ,
+                    Program.to((1, conditions)),
                 )
             )
-            await sim.farm_block()
-            if fund_coin == did_fund_coin:
-                launcher_id = launcher_spend.coin.name()
-                lineage_proof = LineageProof(
-                    parent_name=launcher_spend.coin.parent_coin_info,
-                    amount=uint64(launcher_spend.coin.amount),
-                )
-                did = (await client.get_coin_records_by_parent_ids([launcher_id], include_spent_coins=False))[0].coin
-            else:
-                other_launcher_id = launcher_spend.coin.name()
-                other_lineage_proof = LineageProof(
-                    parent_name=launcher_spend.coin.parent_coin_info,
-                    amount=uint64(launcher_spend.coin.amount),
-                )
-                other_did = (
-                    await client.get_coin_records_by_parent_ids([other_launcher_id], include_spent_coins=False)
-                )[0].coin
+            did_spends.append(launcher_spend)
+            launcher_spends.append(launcher_spend)
+        await client.push_tx(WalletSpendBundle(did_spends, G2Element()))
+        launcher_coin: Coin = launcher_spends[0].coin
+        launcher_id: bytes32 = launcher_coin.name()
+        lineage_proof: LineageProof = LineageProof(
+            parent_name=launcher_coin.parent_coin_info,
+            amount=uint64(launcher_coin.amount),
+        )
+        other_launcher_coin: Coin = launcher_spends[1].coin
+        other_launcher_id: bytes32 = other_launcher_coin.name()
+        other_lineage_proof: LineageProof = LineageProof(
+            parent_name=other_launcher_coin.parent_coin_info,
+            amount=uint64(other_launcher_coin.amount),
+        )
 
-        # Now let's launch the VC
+        # Now let's launch the VC - its bundle doesn't touch the DID coins, so it can ride the
+        # same block instead of farming one for the DIDs first
         vc: VerifiedCredential
         dpuzs, coin_spends, vc = VerifiedCredential.launch(
             [vc_fund_coin],
@@ -523,9 +520,14 @@ async def test_vc_lifecycle(test_syncing: bool, cost_logger: CostLogger) -> None
         )
         await sim.farm_block()
         assert result == (MempoolInclusionStatus.SUCCESS, None)
-        if test_syncing:
-            vc = VerifiedCredential.get_next_from_coin_spend(coin_spends[1])
-            assert VerifiedCredential.is_vc(uncurry_puzzle(coin_spends[1].puzzle_reveal))[0]
+        did: Coin = (await client.get_coin_records_by_parent_ids([launcher_id], include_spent_coins=False))[0].coin
+        other_did: Coin = (
+            await client.get_coin_records_by_parent_ids([other_launcher_id], include_spent_coins=False)
+        )[0].coin
+        # Rather than running the whole sim twice parametrized on syncing, check at each step
+        # that reconstructing the VC from its spend agrees with the locally tracked one
+        assert VerifiedCredential.get_next_from_coin_spend(coin_spends[1]) == vc
+        assert VerifiedCredential.is_vc(uncurry_puzzle(coin_spends[1].puzzle_reveal))[0]
         assert vc.construct_puzzle().get_tree_hash() == vc.coin.puzzle_hash
         assert len(await client.get_coin_records_by_puzzle_hashes([vc.coin.puzzle_hash], include_spent_coins=False)) > 0
 
@@ -539,39 +541,32 @@ async def test_vc_lifecycle(test_syncing: bool, cost_logger: CostLogger) -> None
             new_proof_hash=NEW_PROOF_HASH,
         )
         assert expected_announcement is not None
+        did_puzzle: Program = puzzle_for_singleton(launcher_id, ACS)
+        other_did_puzzle: Program = puzzle_for_singleton(other_launcher_id, ACS)
         for use_did, correct_did in ((False, None), (True, False), (True, True)):
-            result = await client.push_tx(
-                cost_logger.add_cost(
-                    "Update VC proofs (eve covenant spend) - DID providing announcement",
-                    WalletSpendBundle(
-                        [
-                            *(
+            update_spends: list[CoinSpend] = []
+            if use_did:
+                update_spends.append(
+                    make_spend(
+                        did if correct_did else other_did,
+                        did_puzzle if correct_did else other_did_puzzle,
+                        solution_for_singleton(
+                            lineage_proof if correct_did else other_lineage_proof,
+                            uint64(did.amount) if correct_did else uint64(other_did.amount),
+                            Program.to(
                                 [
-                                    make_spend(
-                                        did if correct_did else other_did,
-                                        puzzle_for_singleton(
-                                            launcher_id if correct_did else other_launcher_id,
-                                            ACS,
-                                        ),
-                                        solution_for_singleton(
-                                            lineage_proof if correct_did else other_lineage_proof,
-                                            uint64(did.amount) if correct_did else uint64(other_did.amount),
-                                            Program.to(
-                                                [
-                                                    [51, ACS_PH, did.amount if correct_did else other_did.amount],
-                                                    expected_announcement.to_program(),
-                                                ]
-                                            ),
-                                        ),
-                                    )
+                                    [51, ACS_PH, did.amount if correct_did else other_did.amount],
+                                    expected_announcement.to_program(),
                                 ]
-                                if use_did
-                                else []
                             ),
-                            update_spend,
-                        ],
-                        G2Element(),
-                    ),
+                        ),
+                    )
+                )
+            update_spends.append(update_spend)
+            result = await client.push_tx(
+                cost_logger.add_cost(
+                    "Update VC proofs (eve covenant spend) - DID providing announcement",
+                    WalletSpendBundle(update_spends, G2Element()),
                 )
             )
             if use_did:
@@ -582,36 +577,29 @@ async def test_vc_lifecycle(test_syncing: bool, cost_logger: CostLogger) -> None
             else:
                 assert result == (MempoolInclusionStatus.FAILED, Err.ASSERT_ANNOUNCE_CONSUMED_FAILED)
         await sim.farm_block()
-        if test_syncing:
-            vc = VerifiedCredential.get_next_from_coin_spend(update_spend)
-            assert VerifiedCredential.is_vc(uncurry_puzzle(update_spend.puzzle_reveal))[0]
+        assert VerifiedCredential.get_next_from_coin_spend(update_spend) == vc
+        assert VerifiedCredential.is_vc(uncurry_puzzle(update_spend.puzzle_reveal))[0]
 
         # Now lets farm a funds for some CR-CATs
         await sim.farm_block(RUN_PUZ_PUZ_PH)
         await sim.farm_block(RUN_PUZ_PUZ_PH)
-        cr_fund_coin_1: Coin = (
-            await client.get_coin_records_by_puzzle_hashes([RUN_PUZ_PUZ_PH], include_spent_coins=False)
-        )[0].coin
-        cr_fund_coin_2: Coin = (
-            await client.get_coin_records_by_puzzle_hashes([RUN_PUZ_PUZ_PH], include_spent_coins=False)
-        )[1].coin
-        cr_fund_coin_3: Coin = (
-            await client.get_coin_records_by_puzzle_hashes([RUN_PUZ_PUZ_PH], include_spent_coins=False)
-        )[2].coin
-        cr_fund_coin_4: Coin = (
-            await client.get_coin_records_by_puzzle_hashes([RUN_PUZ_PUZ_PH], include_spent_coins=False)
-        )[3].coin
+        cr_fund_coin_records = await client.get_coin_records_by_puzzle_hashes(
+            [RUN_PUZ_PUZ_PH], include_spent_coins=False
+        )
+        cr_fund_coin_1, cr_fund_coin_2, cr_fund_coin_3, cr_fund_coin_4 = (cr.coin for cr in cr_fund_coin_records[:4])
 
         # Launch the CR-CATs
+        # All four launches are independent, so submit them as one bundle and farm a single block
         malicious_cr_1: CRCAT
         malicious_cr_2: CRCAT
-        for cr_coin_1, cr_coin_2 in ((cr_fund_coin_1, cr_fund_coin_2), (cr_fund_coin_3, cr_fund_coin_4)):
-            if cr_coin_1 == cr_fund_coin_1:
-                proofs = ["malicious"]
-            else:
-                proofs = ["test", "test2"]
+        AUTHORIZED_PROVIDERS: list[bytes32] = [launcher_id]
+        launch_spends: list[CoinSpend] = []
+        crcat_pairs: list[tuple[CRCAT, CRCAT, CoinSpend, CoinSpend]] = []
+        for (cr_coin_1, cr_coin_2), proofs in (
+            ((cr_fund_coin_1, cr_fund_coin_2), ["malicious"]),
+            ((cr_fund_coin_3, cr_fund_coin_4), ["test", "test2"]),
+        ):
             proofs_checker: ProofsChecker = ProofsChecker(proofs)
-            AUTHORIZED_PROVIDERS: list[bytes32] = [launcher_id]
             dpuz_1, launch_crcat_spend_1, cr_1 = CRCAT.launch(
                 cr_coin_1,
                 CreateCoin(ACS_PH, uint64(cr_coin_1.amount)),
@@ -628,36 +616,46 @@ async def test_vc_lifecycle(test_syncing: bool, cost_logger: CostLogger) -> None
                 AUTHORIZED_PROVIDERS,
                 proofs_checker.as_program(),
             )
-            result = await client.push_tx(
-                WalletSpendBundle(
-                    [
-                        make_spend(
-                            cr_coin_1,
-                            RUN_PUZ_PUZ,
-                            dpuz_1,
-                        ),
-                        make_spend(
-                            cr_coin_2,
-                            RUN_PUZ_PUZ,
-                            dpuz_2,
-                        ),
-                        launch_crcat_spend_1,
-                        launch_crcat_spend_2,
-                    ],
-                    G2Element(),
-                )
+            launch_spends.extend(
+                [
+                    make_spend(
+                        cr_coin_1,
+                        RUN_PUZ_PUZ,
+                        dpuz_1,
+                    ),
+                    make_spend(
+                        cr_coin_2,
+                        RUN_PUZ_PUZ,
+                        dpuz_2,
+                    ),
+                    launch_crcat_spend_1,
+                    launch_crcat_spend_2,
+                ]
             )
-            assert result == (MempoolInclusionStatus.SUCCESS, None)
-            await sim.farm_block()
-            if test_syncing:
-                cr_1 = CRCAT.get_next_from_coin_spend(launch_crcat_spend_1)[0]
-                cr_2 = CRCAT.get_next_from_coin_spend(launch_crcat_spend_2)[0]
+            crcat_pairs.append((cr_1, cr_2, launch_crcat_spend_1, launch_crcat_spend_2))
+        result = await client.push_tx(WalletSpendBundle(launch_spends, G2Element()))
+        assert result == (MempoolInclusionStatus.SUCCESS, None)
+        await sim.farm_block()
+        for i, (cr_1, cr_2, launch_crcat_spend_1, launch_crcat_spend_2) in enumerate(crcat_pairs):
+            assert CRCAT.get_next_from_coin_spend(launch_crcat_spend_1)[0] == cr_1
+            assert CRCAT.get_next_from_coin_spend(launch_crcat_spend_2)[0] == cr_2
             assert len(await client.get_coin_records_by_names([cr_1.coin.name()], include_spent_coins=False)) > 0
             assert len(await client.get_coin_records_by_names([cr_2.coin.name()], include_spent_coins=False)) > 0
-            if cr_coin_1 == cr_fund_coin_1:
+            if i == 0:
                 malicious_cr_1 = cr_1
                 malicious_cr_2 = cr_2
 
+        backdoor_ph: bytes32 = vc.wrap_inner_with_backdoor().get_tree_hash()
+        # The announcement asserts and magic condition don't vary across the error cases below
+        magic_condition: Program = vc.standard_magic_condition()
+        honest_announcement_asserts = [
+            [62, cr_1.expected_announcement()],
+            [62, cr_2.expected_announcement()],
+        ]
+        malicious_announcement_asserts = [
+            [62, malicious_cr_1.expected_announcement()],
+            [62, malicious_cr_2.expected_announcement()],
+        ]
         for error in (
             "forget_vc",
             "make_banned_announcement",
@@ -702,57 +700,45 @@ async def test_vc_lifecycle(test_syncing: bool, cost_logger: CostLogger) -> None
                 Program.NIL,
                 launcher_id,
                 vc.launcher_id,
-                vc.wrap_inner_with_backdoor().get_tree_hash(),
+                backdoor_ph,
             )
 
             # Try to spend the coin to ourselves
+            announcement_asserts = (
+                honest_announcement_asserts
+                if error not in {"use_malicious_cats", "attempt_honest_cat_piggyback"}
+                else malicious_announcement_asserts
+            )
             _, auth_spend, new_vc = vc.do_spend(
                 ACS_2,
                 Program.to(
                     [
                         [51, ACS_PH, vc.coin.amount],
-                        [
-                            62,
-                            (
-                                cr_1.expected_announcement()
-                                if error not in {"use_malicious_cats", "attempt_honest_cat_piggyback"}
-                                else malicious_cr_1.expected_announcement()
-                            ),
-                        ],
-                        [
-                            62,
-                            (
-                                cr_2.expected_announcement()
-                                if error not in {"use_malicious_cats", "attempt_honest_cat_piggyback"}
-                                else malicious_cr_2.expected_announcement()
-                            ),
-                        ],
+                        *announcement_asserts,
                         *(a.to_program() for a in expected_announcements),
-                        vc.standard_magic_condition(),
+                        magic_condition,
                     ]
                 ),
             )
 
+            spends_to_push = list(cr_cat_spends)
+            if error != "forget_vc":
+                spends_to_push.append(auth_spend)
             result = await client.push_tx(
                 cost_logger.add_cost(
                     "CR-CATx2 w/ VC announcement, Standard Proof Checker (2 flags)",
-                    WalletSpendBundle(
-                        [
-                            *cr_cat_spends,
-                            *([auth_spend] if error != "forget_vc" else []),
-                        ],
-                        G2Element(),
-                    ),
+                    WalletSpendBundle(spends_to_push, G2Element()),
                 )
             )
             if error is None:
                 assert result == (MempoolInclusionStatus.SUCCESS, None)
-                if test_syncing:
-                    assert all(CRCAT.is_cr_cat(uncurry_puzzle(spend.puzzle_reveal))[0] for spend in cr_cat_spends)
-                    new_crcats = [crcat for spend in cr_cat_spends for crcat in CRCAT.get_next_from_coin_spend(spend)]
-                    vc = VerifiedCredential.get_next_from_coin_spend(auth_spend)
-                else:
-                    vc = new_vc
+                reconstructed_crcats: list[CRCAT] = []
+                for spend in cr_cat_spends:
+                    assert CRCAT.is_cr_cat(uncurry_puzzle(spend.puzzle_reveal))[0]
+                    reconstructed_crcats.extend(CRCAT.get_next_from_coin_spend(spend))
+                assert reconstructed_crcats == new_crcats
+                assert VerifiedCredential.get_next_from_coin_spend(auth_spend) == new_vc
+                vc = new_vc
                 await sim.farm_block()
             elif error in {"forget_vc", "use_malicious_cats", "attempt_honest_cat_piggyback"}:
                 assert result == (MempoolInclusionStatus.FAILED, Err.ASSERT_ANNOUNCE_CONSUMED_FAILED)
@@ -775,10 +761,7 @@ async def test_vc_lifecycle(test_syncing: bool, cost_logger: CostLogger) -> None
                         [
                             make_spend(
                                 new_did,
-                                puzzle_for_singleton(
-                                    launcher_id if correct_did else other_launcher_id,
-                                    ACS,
-                                ),
+                                did_puzzle if correct_did else other_did_puzzle,
                                 solution_for_singleton(
                                     (
                                         LineageProof(
@@ -802,20 +785,15 @@ async def test_vc_lifecycle(test_syncing: bool, cost_logger: CostLogger) -> None
             if correct_did:
                 assert result == (MempoolInclusionStatus.SUCCESS, None)
                 await sim.farm_block()
-                if test_syncing:
-                    with pytest.raises(ValueError):
-                        VerifiedCredential.get_next_from_coin_spend(yoink_spend)
+                with pytest.raises(ValueError):
+                    VerifiedCredential.get_next_from_coin_spend(yoink_spend)
             else:
                 assert result == (MempoolInclusionStatus.FAILED, Err.ASSERT_ANNOUNCE_CONSUMED_FAILED)
 
         # Verify the end state
         new_singletons_puzzle_reveal: Program = puzzle_for_singleton(
             vc.launcher_id,
-            construct_exigent_metadata_layer(
-                None,
-                ACS_TRANSFER_PROGRAM,
-                ACS,
-            ),
+            YOINKED_METADATA_LAYER,
         )
 
         assert (
@@ -858,9 +836,8 @@ async def test_vc_lifecycle(test_syncing: bool, cost_logger: CostLogger) -> None
         )
         assert result == (MempoolInclusionStatus.SUCCESS, None)
         await sim.farm_block()
-        if test_syncing:
-            with pytest.raises(ValueError):
-                VerifiedCredential.get_next_from_coin_spend(clear_spend)
+        with pytest.raises(ValueError):
+            VerifiedCredential.get_next_from_coin_spend(clear_spend)
 
         # Verify the end state
         cleared_singletons_puzzle_reveal: Program = puzzle_for_singleton(
@@ -9,9 +9,12 @@ from chia.cmds.cmds_util import (
     node_config_section_names,
     raise_if_config_section_missing,
 )
+from chia.protocols.outbound_message import NodeType
 from chia.rpc.rpc_client import RpcClient
 from chia.util.network import parse_host_port
 
+_NODE_TYPE_NAME: dict[int, str] = {node_type.value: node_type.name for node_type in NodeType}
+
 
 async def add_node_connection(rpc_client: RpcClient, add_connection: str) -> None:
     try:
@@ -29,41 +32,57 @@ async def add_node_connection(rpc_client: RpcClient, add_connection: str) -> Non
 
 
 async def remove_node_connection(rpc_client: RpcClient, remove_connection: str) -> None:
-    from chia.protocols.outbound_message import NodeType
-
-    result_txt = ""
     if len(remove_connection) != 8:
-        result_txt = "Invalid NodeID. Do not include '.'"
+        print("Invalid NodeID. Do not include '.'")
+        return
+    connections = await rpc_client.get_connections()
+    # The first four bytes of the node id are what the 8-character NodeID prefix encodes
+    con = next((c for c in connections if c["node_id"][:4].hex() == remove_connection), None)
+    if con is None:
+        print(f"NodeID {remove_connection}... not found")
+        return
+    print("Attempting to disconnect", "NodeID", remove_connection)
+    try:
+        await rpc_client.close_connection(con["node_id"])
+    except Exception:
+        print(f"Failed to disconnect NodeID {remove_connection}")
     else:
-        connections = await rpc_client.get_connections()
-        for con in connections:
-            if remove_connection == con["node_id"].hex()[:8]:
-                print("Attempting to disconnect", "NodeID", remove_connection)
-                try:
-                    await rpc_client.close_connection(con["node_id"])
-                except Exception:
-                    result_txt = f"Failed to disconnect NodeID {remove_connection}"
-                else:
-                    result_txt = (
-                        f"NodeID {remove_connection}... {NodeType(con['type']).name} {con['peer_host']} disconnected"
-                    )
-            elif result_txt == "":
-                result_txt = f"NodeID {remove_connection}... not found"
-    print(result_txt)
+        print(f"NodeID {remove_connection}... {_NODE_TYPE_NAME[con['type']]} {con['peer_host']} disconnected")
 
 
 async def print_connections(rpc_client: RpcClient, trusted_peers: dict[str, Any], trusted_cidrs: list[str]) -> None:
+    import ipaddress
+    import sys
     import time
 
-    from chia.protocols.outbound_message import NodeType
-    from chia.util.network import is_trusted_peer
+    from chia.util.network import is_localhost
 
     connections = await rpc_client.get_connections()
-    print("Connections:")
-    print("Type      IP                                      Ports       NodeID      Last Connect" + "      MiB Up|Dwn")
+    # Same checks as is_trusted_peer (testing=False), but with the CIDRs parsed once up front
+    # instead of re-parsing every network string for every connection
+    trusted_networks = [ipaddress.ip_network(cidr) for cidr in trusted_cidrs]
+
+    def check_trusted(host: str, node_id: bytes) -> bool:
+        if is_localhost(host) or node_id.hex() in trusted_peers:
+            return True
+        if len(trusted_networks) == 0:
+            return False
+        try:
+            ip_obj = ipaddress.ip_address(host)
+        except ValueError:
+            return False
+        return any(ip_obj in network for network in trusted_networks)
+
+    # Accumulate the whole report and emit it with one write rather than a print per row,
+    # and avoid re-resolving module attributes for every connection
+    localtime = time.localtime
+    strftime = time.strftime
+    out = [
+        "Connections:\n",
+        "Type      IP                                      Ports       NodeID      Last Connect      MiB Up|Dwn\n",
+    ]
     for con in connections:
-        last_connect_tuple = time.struct_time(time.localtime(con["last_message_time"]))
-        last_connect = time.strftime("%b %d %T", last_connect_tuple)
+        last_connect = strftime("%b %d %T", localtime(con["last_message_time"]))
         mb_down = con["bytes_read"] / (1024 * 1024)
         mb_up = con["bytes_written"] / (1024 * 1024)
 
@@ -71,9 +90,16 @@ async def print_connections(rpc_client: RpcClient, trusted_peers: dict[str, Any]
         # Strip IPv6 brackets
         host = host.strip("[]")
 
-        trusted: bool = is_trusted_peer(host, con["node_id"], trusted_peers, trusted_cidrs, False)
+        trusted: bool = check_trusted(host, con["node_id"])
         # Nodetype length is 9 because INTRODUCER will be deprecated
-        if NodeType(con["type"]) is NodeType.FULL_NODE:
+        con_str = (
+            f"{_NODE_TYPE_NAME[con['type']]:9} {host:39} "
+            f"{con['peer_port']:5}/{con['peer_server_port']:<5}"
+            f" {con['node_id'][:4].hex()}... "
+            f"{last_connect}  "
+            f"{mb_up:7.1f}|{mb_down:<7.1f}"
+        )
+        if con["type"] == NodeType.FULL_NODE.value:
             peak_height = con.get("peak_height", None)
             connection_peak_hash = con.get("peak_hash", None)
             if connection_peak_hash is None:
@@ -82,32 +108,16 @@ async def print_connections(rpc_client: RpcClient, trusted_peers: dict[str, Any]
                 if connection_peak_hash.startswith(("0x", "0X")):
                     connection_peak_hash = connection_peak_hash[2:]
                 connection_peak_hash = f"{connection_peak_hash[:8]}..."
-            con_str = (
-                f"{NodeType(con['type']).name:9} {host:39} "
-                f"{con['peer_port']:5}/{con['peer_server_port']:<5}"
-                f" {con['node_id'].hex()[:8]}... "
-                f"{last_connect}  "
-                f"{mb_up:7.1f}|{mb_down:<7.1f}"
-                f"\n                                                  "
-            )
+            con_str += "\n                                                  "
             if peak_height is not None:
                 con_str += f"-Height: {peak_height:8.0f}    -Hash: {connection_peak_hash}"
             else:
                 con_str += f"-Height: No Info    -Hash: {connection_peak_hash}"
-            # Only show when Trusted is True
-            if trusted:
-                con_str += f"    -Trusted: {trusted}"
-        else:
-            con_str = (
-                f"{NodeType(con['type']).name:9} {host:39} "
-                f"{con['peer_port']:5}/{con['peer_server_port']:<5}"
-                f" {con['node_id'].hex()[:8]}... "
-                f"{last_connect}  "
-                f"{mb_up:7.1f}|{mb_down:<7.1f}"
-            )
-            if trusted:
-                con_str += f"    -Trusted: {trusted}"
-        print(con_str)
+        # Only show when Trusted is True
+        if trusted:
+            con_str += f"    -Trusted: {trusted}"
+        out.append(con_str + "\n")
+    sys.stdout.write("".join(out))
 
 
 async def peer_async(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, get_type_hints
 
 from typing_extensions import Protocol, Self
 
@@ -32,22 +33,19 @@ class RouteDecorator(Protocol):
 
 def marshal() -> RouteDecorator:
     def decorator(route: UnboundMarshalledRoute) -> UnboundRoute:
-        from typing import get_type_hints
-
         hints = get_type_hints(route)
         request_class: type[MarshallableProtocol] = hints["request"]
 
-        async def wrapper(self: object, request: dict[str, object]) -> dict[str, object]:
-            # import json
-            # name = route.__name__
-            # print(f"\n ==== {name} request.json\n{json.dumps(request, indent=2)}")
-            unmarshalled_request = request_class.unmarshal(request)
-
-            response = await route(self, request=unmarshalled_request)
-            marshalled_response = response.marshal()
-            # print(f"\n ==== {name} response.json\n{json.dumps(marshalled_response, indent=2)}")
-
-            return marshalled_response
+        # The route and unmarshal callables are bound as default arguments so the per-request
+        # path uses local variable loads instead of closure cell and attribute lookups.
+        async def wrapper(
+            self: object,
+            request: dict[str, object],
+            _route: UnboundMarshalledRoute = route,
+            _unmarshal: Callable[[dict[str, Any]], MarshallableProtocol] = request_class.unmarshal,
+        ) -> dict[str, object]:
+            response = await _route(self, request=_unmarshal(request))
+            return response.marshal()
 
         # type ignoring since mypy is having issues with bound vs. unbound methods
         return wrapper  # type: ignore[return-value]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
+import functools
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
@@ -17,6 +19,7 @@ from chia.data_layer.singleton_record import SingletonRecord
 from chia.server.ws_connection import WSChiaConnection
 from chia.types.blockchain_format.coin import Coin
 from chia.types.blockchain_format.program import Program, run_with_cost
+from chia.types.blockchain_format.serialized_program import SerializedProgram
 from chia.types.coin_spend import make_spend
 from chia.types.condition_opcodes import ConditionOpcode
 from chia.util.streamable import Streamable, streamable
@@ -33,6 +36,7 @@ from chia.wallet.db_wallet.db_wallet_puzzles import (
     ACS_MU,
     ACS_MU_PH,
     GRAFTROOT_DL_OFFERS,
+    MIRROR_PUZZLE_HASH,
     create_graftroot_offer_puz,
     create_host_fullpuz,
     create_host_layer_puzzle,
@@ -64,6 +68,53 @@ if TYPE_CHECKING:
     from chia.wallet.wallet_state_manager import WalletStateManager
 
 
+# Chain sync replays the same singleton states over and over, so cache the tree hashes of the
+# wrapper puzzles instead of re-hashing the same structure around each (inner hash, root) pair
+@functools.lru_cache(maxsize=4096)
+def _full_puz_hash(inner_puzzle_hash: bytes32, root: bytes32, launcher_id: bytes32) -> bytes32:
+    return create_host_fullpuz(inner_puzzle_hash, root, launcher_id).get_tree_hash_precalc(inner_puzzle_hash)
+
+
+@functools.lru_cache(maxsize=4096)
+def _host_layer_hash(inner_puzzle_hash: bytes32, root: bytes32) -> bytes32:
+    return create_host_layer_puzzle(inner_puzzle_hash, root).get_tree_hash_precalc(inner_puzzle_hash)
+
+
+# Constant sub-programs of the spends built below, allocated once instead of per call
+_QUOTE_ONE = Program.to(1)
+_ANNOUNCE_TAIL = Program.to([62, b"$"])  # (CREATE_PUZZLE_ANNOUNCEMENT "$")
+_NEW_METADATA_OPCODE = Program.to(-24)
+# Placeholder graftroot solution filled in later by finish_graftroot_solutions
+_NULL_GRAFTROOT_SOLUTION = Program.to([None] * 5)
+
+# Serialized once so the launcher check during sync is a plain bytes comparison
+_SINGLETON_LAUNCHER_SER = SINGLETON_LAUNCHER_PUZZLE.to_serialized()
+
+# Hex forms of process-constant hashes used by the potentially polled driver info path
+_LAUNCHER_PH_HEX = "0x" + SINGLETON_LAUNCHER_PUZZLE_HASH.hex()
+_ACS_MU_PH_HEX = "0x" + ACS_MU_PH.hex()
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_dl_singleton(puzzle_reveal: SerializedProgram) -> tuple[bool, tuple[Program, ...]]:
+    # Singleton templates repeat across the spends of an offer and across coin events during
+    # sync; materialize the curried args so a cached result can be consumed more than once
+    matched, curried_args = match_dl_singleton(puzzle_reveal)
+    return matched, tuple(curried_args)
+
+
+@functools.lru_cache(maxsize=16)
+def _acs_mu_ph_list(count: int) -> Program:
+    # Dependency counts are small and repeat, so reuse the converted program per length
+    return Program.to([ACS_MU_PH] * count)
+
+
+@functools.lru_cache(maxsize=512)
+def _new_metadata_args(root_hash: bytes32) -> Program:
+    # Only the root hash leaf varies; the same root repeats across retried/queued updates
+    return Program.to([[(root_hash, None), ACS_MU_PH], None])
+
+
 @streamable
 @dataclasses.dataclass(frozen=True)
 class Mirror(Streamable):
@@ -76,11 +127,12 @@ class Mirror(Streamable):
 
     @staticmethod
     def encode_urls(urls: list[str]) -> list[bytes]:
-        return [url.encode("utf8") for url in urls]
+        # map with the unbound C method skips the per-element attribute lookup (UTF-8 is the default)
+        return list(map(str.encode, urls))
 
     @staticmethod
     def decode_urls(urls: list[bytes]) -> list[str]:
-        return [url.decode("utf8") for url in urls]
+        return list(map(bytes.decode, urls))
 
 
 @streamable
@@ -172,7 +224,7 @@ class DataLayerWallet:
     @staticmethod
     async def match_dl_launcher(launcher_spend: CoinSpend) -> tuple[bool, bytes32 | None]:
         # Sanity check it's a launcher
-        if launcher_spend.puzzle_reveal != SINGLETON_LAUNCHER_PUZZLE.to_serialized():
+        if launcher_spend.puzzle_reveal != _SINGLETON_LAUNCHER_SER:
             return False, None
 
         # Let's make sure the solution looks how we expect it to
@@ -184,11 +236,7 @@ class DataLayerWallet:
             return False, None
 
         # Now let's check that the full puzzle is an odd data layer singleton
-        if (
-            full_puzhash
-            != create_host_fullpuz(inner_puzhash, root, launcher_spend.coin.name()).get_tree_hash_precalc(inner_puzhash)
-            or amount % 2 == 0
-        ):
+        if full_puzhash != _full_puz_hash(inner_puzhash, root, launcher_spend.coin.name()) or amount % 2 == 0:
             return False, None
 
         return True, inner_puzhash
@@ -232,64 +280,94 @@ class DataLayerWallet:
             Program.from_serialized(spend.solution)
         )
         new_singleton = Coin(launcher_id, full_puzhash, amount)
-
-        singleton_record: SingletonRecord | None = await self.wallet_state_manager.dl_store.get_latest_singleton(
-            launcher_id
+        new_singleton_name = new_singleton.name()
+
+        # The timestamp lookup (potentially a peer request) and the singleton lookup are
+        # independent, so overlap them; the timestamp goes unused only in the rare
+        # launcher-restore case below
+        timestamp, singleton_record = await asyncio.gather(
+            self.wallet_state_manager.wallet_node.get_timestamp_for_height(height),
+            self.wallet_state_manager.dl_store.get_latest_singleton(launcher_id),
         )
-        if singleton_record is not None:
-            if (  # This is an unconfirmed singleton that we know about
-                singleton_record.coin_id == new_singleton.name() and not singleton_record.confirmed
-            ):
-                timestamp = await self.wallet_state_manager.wallet_node.get_timestamp_for_height(height)
+        confirming_known_singleton = (  # This is an unconfirmed singleton that we know about
+            singleton_record is not None
+            and singleton_record.coin_id == new_singleton_name
+            and not singleton_record.confirmed
+        )
+        if singleton_record is not None and not confirming_known_singleton:
+            # Singleton has advanced beyond generation 0 but the launcher entry
+            # is missing (already verified at the top of this function). This
+            # happens after a wallet rollback deletes the launchers row while
+            # the singleton_records survive.  Fall through to restore it.
+            self.log.info(
+                f"Singleton {launcher_id} already tracked at generation "
+                f"{singleton_record.generation}, restoring launcher entry"
+            )
+
+        # Land all of the writes for this launcher in one transaction rather than a commit each
+        async with self.wallet_state_manager.db_wrapper.writer():
+            if confirming_known_singleton:
+                assert singleton_record is not None
                 await self.wallet_state_manager.dl_store.set_confirmed(singleton_record.coin_id, height, timestamp)
-            else:
-                # Singleton has advanced beyond generation 0 but the launcher entry
-                # is missing (already verified at the top of this function). This
-                # happens after a wallet rollback deletes the launchers row while
-                # the singleton_records survive.  Fall through to restore it.
-                self.log.info(
-                    f"Singleton {launcher_id} already tracked at generation "
-                    f"{singleton_record.generation}, restoring launcher entry"
-                )
-        else:
-            timestamp = await self.wallet_state_manager.wallet_node.get_timestamp_for_height(height)
-            await self.wallet_state_manager.dl_store.add_singleton_record(
-                SingletonRecord(
-                    coin_id=new_singleton.name(),
-                    launcher_id=launcher_id,
-                    root=root,
-                    inner_puzzle_hash=inner_puzhash,
-                    confirmed=True,
-                    confirmed_at_height=height,
-                    timestamp=timestamp,
-                    lineage_proof=LineageProof(
-                        launcher_id,
-                        create_host_layer_puzzle(inner_puzhash, root).get_tree_hash_precalc(inner_puzhash),
-                        amount,
-                    ),
-                    generation=uint32(0),
+            elif singleton_record is None:
+                await self.wallet_state_manager.dl_store.add_singleton_record(
+                    SingletonRecord(
+                        coin_id=new_singleton_name,
+                        launcher_id=launcher_id,
+                        root=root,
+                        inner_puzzle_hash=inner_puzhash,
+                        confirmed=True,
+                        confirmed_at_height=height,
+                        timestamp=timestamp,
+                        lineage_proof=LineageProof(
+                            launcher_id,
+                            _host_layer_hash(inner_puzhash, root),
+                            amount,
+                        ),
+                        generation=uint32(0),
+                    )
                 )
-            )
 
-        await self.wallet_state_manager.dl_store.add_launcher(spend.coin, height)
-        await self.wallet_state_manager.add_interested_puzzle_hashes([launcher_id], [self.id()])
-        await self.wallet_state_manager.add_interested_coin_ids([new_singleton.name()])
+            await self.wallet_state_manager.dl_store.add_launcher(spend.coin, height)
+            await self.wallet_state_manager.add_interested_puzzle_hashes([launcher_id], [self.id()])
+            await self.wallet_state_manager.add_interested_coin_ids([new_singleton_name])
 
         new_singleton_coin_record: WalletCoinRecord | None = await self.wallet_state_manager.coin_store.get_coin_record(
-            new_singleton.name()
+            new_singleton_name
         )
+        next_spend_task: asyncio.Task[CoinSpend] | None = None
         while new_singleton_coin_record is not None and new_singleton_coin_record.spent_block_height > 0:
             # We've already synced this before, so we need to sort of force a resync
-            parent_spend = await fetch_coin_spend(new_singleton_coin_record.spent_block_height, new_singleton, peer)
-            await self.singleton_removed(parent_spend, new_singleton_coin_record.spent_block_height)
-            try:
-                additions = compute_additions(parent_spend)
-                new_singleton = next(coin for coin in additions if coin.amount % 2 != 0)
+            if next_spend_task is not None:
+                parent_spend = await next_spend_task
+            else:
+                parent_spend = await fetch_coin_spend(new_singleton_coin_record.spent_block_height, new_singleton, peer)
+            spent_height = new_singleton_coin_record.spent_block_height
+            # Work out the next singleton before processing this spend so the fetch of its spend
+            # (the per-iteration network round trip) can overlap with singleton_removed
+            found: Coin | None = None
+            for coin in compute_additions(parent_spend):
+                if coin.amount & 1:
+                    found = coin
+                    break
+            if found is None:
+                new_singleton_coin_record = None
+            else:
+                new_singleton = found
                 new_singleton_coin_record = await self.wallet_state_manager.coin_store.get_coin_record(
                     new_singleton.name()
                 )
-            except StopIteration:
-                new_singleton_coin_record = None
+            next_spend_task = None
+            if new_singleton_coin_record is not None and new_singleton_coin_record.spent_block_height > 0:
+                next_spend_task = asyncio.create_task(
+                    fetch_coin_spend(new_singleton_coin_record.spent_block_height, new_singleton, peer)
+                )
+            try:
+                await self.singleton_removed(parent_spend, spent_height)
+            except Exception:
+                if next_spend_task is not None:
+                    next_spend_task.cancel()
+                raise
 
     ################
     # TRANSACTIONS #
@@ -312,15 +390,16 @@ class DataLayerWallet:
 
         launcher_parent: Coin = next(iter(coins))
         launcher_coin: Coin = Coin(launcher_parent.name(), SINGLETON_LAUNCHER_PUZZLE_HASH, uint64(1))
+        launcher_id = launcher_coin.name()
 
         inner_puzzle: Program = await action_scope.get_puzzle(self.wallet_state_manager)
-        full_puzzle: Program = create_host_fullpuz(inner_puzzle, initial_root, launcher_coin.name())
+        full_puzzle: Program = create_host_fullpuz(inner_puzzle, initial_root, launcher_id)
 
         genesis_launcher_solution: Program = Program.to(
             [full_puzzle.get_tree_hash(), 1, [initial_root, inner_puzzle.get_tree_hash()]]
         )
         announcement_message: bytes32 = genesis_launcher_solution.get_tree_hash()
-        announcement = AssertCoinAnnouncement(asserted_id=launcher_coin.name(), asserted_msg=announcement_message)
+        announcement = AssertCoinAnnouncement(asserted_id=launcher_id, asserted_msg=announcement_message)
 
         await self.standard_wallet.generate_signed_transaction(
             amounts=[uint64(1)],
@@ -338,7 +417,6 @@ class DataLayerWallet:
             genesis_launcher_solution,
         )
         launcher_sb = WalletSpendBundle([launcher_cs], G2Element())
-        launcher_id = launcher_coin.name()
 
         async with action_scope.use() as interface:
             interface.side_effects.extra_spends.append(launcher_sb)
@@ -407,9 +485,7 @@ class DataLayerWallet:
         if new_puz_hash is None:
             new_puz_hash = await action_scope.get_puzzle_hash(self.wallet_state_manager)
         assert new_puz_hash is not None
-        next_full_puz_hash: bytes32 = create_host_fullpuz(new_puz_hash, root_hash, launcher_id).get_tree_hash_precalc(
-            new_puz_hash
-        )
+        next_full_puz_hash: bytes32 = _full_puz_hash(new_puz_hash, root_hash, launcher_id)
 
         # Construct the current puzzles
         current_inner_puzzle: Program = self.standard_wallet.puzzle_for_pk(inner_puzzle_derivation.pubkey)
@@ -425,28 +501,13 @@ class DataLayerWallet:
             current_full_puz.get_tree_hash(),
             singleton_record.lineage_proof.amount,
         )
-
-        new_singleton_record = SingletonRecord(
-            coin_id=Coin(current_coin.name(), next_full_puz_hash, singleton_record.lineage_proof.amount).name(),
-            launcher_id=launcher_id,
-            root=root_hash,
-            inner_puzzle_hash=new_puz_hash,
-            confirmed=False,
-            confirmed_at_height=uint32(0),
-            timestamp=uint64(0),
-            lineage_proof=LineageProof(
-                singleton_record.coin_id,
-                new_puz_hash,
-                singleton_record.lineage_proof.amount,
-            ),
-            generation=uint32(singleton_record.generation + 1),
-        )
+        current_coin_name = current_coin.name()
 
         # Optionally add an ephemeral spend to announce
         if announce_new_state:
             announce_only: Program = Program.to(
                 (
-                    1,
+                    _QUOTE_ONE,
                     [
                         [
                             51,
@@ -454,18 +515,19 @@ class DataLayerWallet:
                             singleton_record.lineage_proof.amount,
                             [launcher_id, root_hash, new_puz_hash],
                         ],
-                        [62, b"$"],
+                        _ANNOUNCE_TAIL,
                     ],
                 )
             )
+            announce_only_hash: bytes32 = announce_only.get_tree_hash()
             second_full_puz: Program = create_host_fullpuz(
                 announce_only,
                 root_hash,
                 launcher_id,
             )
-            second_coin = Coin(
-                current_coin.name(), second_full_puz.get_tree_hash(), singleton_record.lineage_proof.amount
-            )
+            second_full_puz_hash: bytes32 = second_full_puz.get_tree_hash()
+            second_coin = Coin(current_coin_name, second_full_puz_hash, singleton_record.lineage_proof.amount)
+            second_coin_name = second_coin.name()
             second_coin_spend = make_spend(
                 second_coin,
                 second_full_puz,
@@ -481,44 +543,64 @@ class DataLayerWallet:
                     ]
                 ),
             )
-            extra_conditions += (
-                AssertPuzzleAnnouncement(asserted_ph=second_full_puz.get_tree_hash(), asserted_msg=b"$"),
-            )
+            extra_conditions += (AssertPuzzleAnnouncement(asserted_ph=second_full_puz_hash, asserted_msg=b"$"),)
             second_singleton_record = SingletonRecord(
-                coin_id=second_coin.name(),
+                coin_id=second_coin_name,
                 launcher_id=launcher_id,
                 root=root_hash,
-                inner_puzzle_hash=announce_only.get_tree_hash(),
+                inner_puzzle_hash=announce_only_hash,
                 confirmed=False,
                 confirmed_at_height=uint32(0),
                 timestamp=uint64(0),
                 lineage_proof=LineageProof(
                     second_coin.parent_coin_info,
-                    announce_only.get_tree_hash(),
+                    announce_only_hash,
                     singleton_record.lineage_proof.amount,
                 ),
                 generation=uint32(singleton_record.generation + 1),
             )
-            new_singleton_record = dataclasses.replace(
-                new_singleton_record,
-                coin_id=Coin(second_coin.name(), next_full_puz_hash, singleton_record.lineage_proof.amount).name(),
+            new_singleton_record = SingletonRecord(
+                coin_id=Coin(second_coin_name, next_full_puz_hash, singleton_record.lineage_proof.amount).name(),
+                launcher_id=launcher_id,
+                root=root_hash,
+                inner_puzzle_hash=new_puz_hash,
+                confirmed=False,
+                confirmed_at_height=uint32(0),
+                timestamp=uint64(0),
                 lineage_proof=LineageProof(
-                    second_coin.name(),
+                    second_coin_name,
                     next_full_puz_hash,
                     singleton_record.lineage_proof.amount,
                 ),
                 generation=uint32(second_singleton_record.generation + 1),
             )
+        else:
+            new_singleton_record = SingletonRecord(
+                coin_id=Coin(current_coin_name, next_full_puz_hash, singleton_record.lineage_proof.amount).name(),
+                launcher_id=launcher_id,
+                root=root_hash,
+                inner_puzzle_hash=new_puz_hash,
+                confirmed=False,
+                confirmed_at_height=uint32(0),
+                timestamp=uint64(0),
+                lineage_proof=LineageProof(
+                    singleton_record.coin_id,
+                    new_puz_hash,
+                    singleton_record.lineage_proof.amount,
+                ),
+                generation=uint32(singleton_record.generation + 1),
+            )
 
         # Create the solution
+        next_inner_puzhash: bytes32 = announce_only_hash if announce_new_state else new_puz_hash
         primaries = [
             CreateCoin(
-                announce_only.get_tree_hash() if announce_new_state else new_puz_hash,
+                next_inner_puzhash,
                 singleton_record.lineage_proof.amount if new_amount is None else new_amount,
                 [
                     launcher_id,
                     root_hash,
-                    announce_only.get_tree_hash() if announce_new_state else new_puz_hash,
+                    next_inner_puzhash,
                 ],
             )
         ]
@@ -526,10 +608,10 @@ class DataLayerWallet:
             extra_conditions = (
                 *extra_conditions,
                 UnknownCondition(
-                    opcode=Program.to(-24),
+                    opcode=_NEW_METADATA_OPCODE,
                     args=[
                         ACS_MU,
-                        Program.to([[(root_hash, None), ACS_MU_PH], None]),
+                        _new_metadata_args(root_hash),
                     ],
                 ),
             )
@@ -553,10 +635,8 @@ class DataLayerWallet:
             full_sol,
         )
 
-        spend_bundle = WalletSpendBundle([coin_spend], G2Element())
-
-        if announce_new_state:
-            spend_bundle = WalletSpendBundle([coin_spend, second_coin_spend], spend_bundle.aggregated_signature)
+        spends = [coin_spend, second_coin_spend] if announce_new_state else [coin_spend]
+        spend_bundle = WalletSpendBundle(spends, G2Element())
 
         dl_tx = self.wallet_state_manager.new_outgoing_transaction(
             wallet_id=self.id(),
@@ -573,7 +653,7 @@ class DataLayerWallet:
         if fee > 0:
             await self.create_tandem_xch_tx(
                 fee,
-                AssertAnnouncement(True, asserted_origin_id=current_coin.name(), asserted_msg=b"$"),
+                AssertAnnouncement(True, asserted_origin_id=current_coin_name, asserted_msg=b"$"),
                 action_scope,
             )
 
@@ -664,23 +744,23 @@ class DataLayerWallet:
     async def get_owned_singletons(self) -> list[SingletonRecord]:
         launcher_ids = await self.wallet_state_manager.dl_store.get_all_launchers()
 
-        collected = []
-
-        for launcher_id in launcher_ids:
-            singleton_record = await self.wallet_state_manager.dl_store.get_latest_singleton(launcher_id=launcher_id)
-            if singleton_record is None:
-                # this is likely due to a race between getting the list and acquiring the extra data
-                continue
-
-            inner_puzzle_derivation: (
-                DerivationRecord | None
-            ) = await self.wallet_state_manager.puzzle_store.get_derivation_record_for_puzzle_hash(
-                singleton_record.inner_puzzle_hash
+        # The per-launcher lookups are independent reads, so overlap them rather than awaiting
+        # 2N queries one at a time
+        singleton_records = await asyncio.gather(
+            *(
+                self.wallet_state_manager.dl_store.get_latest_singleton(launcher_id=launcher_id)
+                for launcher_id in launcher_ids
             )
-            if inner_puzzle_derivation is not None:
-                collected.append(singleton_record)
-
-        return collected
+        )
+        # Missing records are likely due to a race between getting the list and acquiring the extra data
+        found = [record for record in singleton_records if record is not None]
+        derivations = await asyncio.gather(
+            *(
+                self.wallet_state_manager.puzzle_store.get_derivation_record_for_puzzle_hash(record.inner_puzzle_hash)
+                for record in found
+            )
+        )
+        return [record for record, derivation in zip(found, derivations) if derivation is not None]
 
     async def create_new_mirror(
         self,
@@ -693,10 +773,10 @@ class DataLayerWallet:
     ) -> None:
         await self.standard_wallet.generate_signed_transaction(
             amounts=[amount],
-            puzzle_hashes=[create_mirror_puzzle().get_tree_hash()],
+            puzzle_hashes=[MIRROR_PUZZLE_HASH],
             action_scope=action_scope,
             fee=fee,
-            memos=[[launcher_id, *(url for url in urls)]],
+            memos=[[launcher_id, *urls]],
             extra_conditions=extra_conditions,
         )
 
@@ -771,7 +851,7 @@ class DataLayerWallet:
     ###########
 
     async def coin_added(self, coin: Coin, height: uint32, peer: WSChiaConnection, coin_data: object | None) -> None:
-        if coin.puzzle_hash == create_mirror_puzzle().get_tree_hash():
+        if coin.puzzle_hash == MIRROR_PUZZLE_HASH:
             parent_state: CoinState = (
                 await self.wallet_state_manager.wallet_node.get_coin_state([coin.parent_coin_info], peer=peer)
             )[0]
@@ -800,7 +880,7 @@ class DataLayerWallet:
         puzzle = parent_spend.puzzle_reveal
         solution = parent_spend.solution
 
-        matched, _ = match_dl_singleton(puzzle)
+        matched, _ = _match_dl_singleton(puzzle)
         if matched:
             self.log.info(f"DL singleton removed: {parent_spend.coin}")
             singleton_record: SingletonRecord | None = await self.wallet_state_manager.dl_store.get_singleton_record(
@@ -816,25 +896,30 @@ class DataLayerWallet:
             root: bytes32
             inner_puzzle_hash: bytes32
 
-            conditions = run_with_cost(puzzle, self.wallet_state_manager.constants.MAX_BLOCK_COST_CLVM, solution)[
-                1
-            ].as_python()
+            conditions = run_with_cost(puzzle, self.wallet_state_manager.constants.MAX_BLOCK_COST_CLVM, solution)[1]
             found_singleton: bool = False
-            for condition in conditions:
-                if condition[0] == ConditionOpcode.CREATE_COIN and int.from_bytes(condition[2], "big") % 2 == 1:
-                    full_puzzle_hash = bytes32(condition[1])
-                    amount = uint64(int.from_bytes(condition[2], "big"))
-                    try:
-                        root = bytes32(condition[3][1])
-                        inner_puzzle_hash = bytes32(condition[3][2])
-                    except IndexError:
-                        self.log.warning(
-                            f"Parent {parent_name} with launcher {singleton_record.launcher_id} "
-                            "did not hint its child properly"
-                        )
-                        return
-                    found_singleton = True
-                    break
+            # Inspect the conditions lazily rather than materializing the whole list to Python;
+            # an odd amount shows in the low bit of the atom's last byte
+            for condition in conditions.as_iter():
+                if condition.at("f").as_atom() != ConditionOpcode.CREATE_COIN:
+                    continue
+                amount_bytes = condition.at("rrf").as_atom()
+                if len(amount_bytes) == 0 or amount_bytes[-1] & 1 == 0:
+                    continue
+                full_puzzle_hash = bytes32(condition.at("rf").as_atom())
+                amount = uint64(int.from_bytes(amount_bytes, "big"))
+                try:
+                    memos = condition.at("rrrf")
+                    root = bytes32(memos.at("rf").as_atom())
+                    inner_puzzle_hash = bytes32(memos.at("rrf").as_atom())
+                except EvalError:
+                    self.log.warning(
+                        f"Parent {parent_name} with launcher {singleton_record.launcher_id} "
+                        "did not hint its child properly"
+                    )
+                    return
+                found_singleton = True
+                break
 
             if not found_singleton:
                 self.log.warning(f"Singleton with launcher ID {singleton_record.launcher_id} was melted")
@@ -853,7 +938,7 @@ class DataLayerWallet:
                     timestamp=timestamp,
                     lineage_proof=LineageProof(
                         parent_name,
-                        create_host_layer_puzzle(inner_puzzle_hash, root).get_tree_hash_precalc(inner_puzzle_hash),
+                        _host_layer_hash(inner_puzzle_hash, root),
                         amount,
                     ),
                     generation=uint32(singleton_record.generation + 1),
@@ -862,7 +947,7 @@ class DataLayerWallet:
             await self.wallet_state_manager.add_interested_coin_ids(
                 [new_singleton.name()],
             )
-        elif parent_spend.coin.puzzle_hash == create_mirror_puzzle().get_tree_hash():
+        elif parent_spend.coin.puzzle_hash == MIRROR_PUZZLE_HASH:
             await self.wallet_state_manager.dl_store.delete_mirror(parent_name)
 
     async def stop_tracking_singleton(self, launcher_id: bytes32) -> None:
@@ -982,11 +1067,11 @@ class DataLayerWallet:
             {
                 "type": AssetType.SINGLETON.value,
                 "launcher_id": "0x" + launcher_id.hex(),
-                "launcher_ph": "0x" + SINGLETON_LAUNCHER_PUZZLE_HASH.hex(),
+                "launcher_ph": _LAUNCHER_PH_HEX,
                 "also": {
                     "type": AssetType.METADATA.value,
                     "metadata": f"(0x{record.root} . ())",
-                    "updater_hash": "0x" + ACS_MU_PH.hex(),
+                    "updater_hash": _ACS_MU_PH_HEX,
                 },
             }
         )
@@ -995,9 +1080,7 @@ class DataLayerWallet:
         record = await self.get_latest_singleton(launcher_id)
         if record is None:
             raise ValueError(f"DL wallet does not know about launcher ID {launcher_id}")
-        puzhash: bytes32 = create_host_fullpuz(
-            record.inner_puzzle_hash, record.root, launcher_id
-        ).get_tree_hash_precalc(record.inner_puzzle_hash)
+        puzhash: bytes32 = _full_puz_hash(record.inner_puzzle_hash, record.root, launcher_id)
         assert record.lineage_proof.parent_name is not None
         assert record.lineage_proof.amount is not None
         return {Coin(record.lineage_proof.parent_name, puzhash, record.lineage_proof.amount)}
@@ -1047,12 +1130,23 @@ class DataLayerWallet:
                 extra_conditions = tuple()
 
                 async with inner_action_scope.use() as interface:
-                    dl_spend: CoinSpend = next(
-                        cs
-                        for tx in interface.side_effects.transactions
-                        for cs in tx.spend_bundle.coin_spends
-                        if tx.spend_bundle is not None and match_dl_singleton(cs.puzzle_reveal)[0]
-                    )
+                    # Find the DL singleton spend and remember which transaction holds it so the
+                    # replacement below doesn't need a second scan
+                    dl_spend: CoinSpend | None = None
+                    dl_tx_index = 0
+                    for i, tx in enumerate(interface.side_effects.transactions):
+                        if tx.spend_bundle is None:
+                            continue
+                        for cs in tx.spend_bundle.coin_spends:
+                            if _match_dl_singleton(cs.puzzle_reveal)[0]:
+                                dl_spend = cs
+                                dl_tx_index = i
+                                break
+                        if dl_spend is not None:
+                            break
+                    if dl_spend is None:
+                        # No test coverage for this line because it should never be reached
+                        raise RuntimeError("Internal logic error while constructing update offer")  # pragma: no cover
                 dl_solution = Program.from_serialized(dl_spend.solution)
                 old_graftroot: Program = dl_solution.at("rrffrf")
                 new_graftroot: Program = create_graftroot_offer_puz(
@@ -1061,28 +1155,20 @@ class DataLayerWallet:
                     old_graftroot,
                 )
 
-                new_solution: Program = dl_solution.replace(rrffrf=new_graftroot, rrffrrf=Program.to([None] * 5))
+                new_solution: Program = dl_solution.replace(rrffrf=new_graftroot, rrffrrf=_NULL_GRAFTROOT_SOLUTION)
                 new_spend: CoinSpend = dl_spend.replace(solution=new_solution.to_serialized())
                 async with inner_action_scope.use() as interface:
-                    for i, tx in enumerate(interface.side_effects.transactions):
-                        if tx.spend_bundle is not None and dl_spend in tx.spend_bundle.coin_spends:
-                            break
-                    else:
-                        # No test coverage for this line because it should never be reached
-                        raise RuntimeError("Internal logic error while constructing update offer")  # pragma: no cover
+                    dl_tx = interface.side_effects.transactions[dl_tx_index]
+                    assert dl_tx.spend_bundle is not None
                     new_bundle = WalletSpendBundle(
                         [
-                            *(
-                                cs
-                                for cs in interface.side_effects.transactions[i].spend_bundle.coin_spends
-                                if cs != dl_spend
-                            ),
+                            *(cs for cs in dl_tx.spend_bundle.coin_spends if cs != dl_spend),
                             new_spend,
                         ],
                         G2Element(),
                     )
-                    interface.side_effects.transactions[i] = dataclasses.replace(
-                        interface.side_effects.transactions[i], spend_bundle=new_bundle, name=new_bundle.name()
+                    interface.side_effects.transactions[dl_tx_index] = dataclasses.replace(
+                        dl_tx, spend_bundle=new_bundle, name=new_bundle.name()
                     )
 
             all_transactions.extend(inner_action_scope.side_effects.transactions)
@@ -1110,7 +1196,7 @@ class DataLayerWallet:
         singleton_to_root: dict[bytes32, bytes32] = {}
         all_parent_ids: list[bytes32] = [cs.coin.parent_coin_info for cs in offer.coin_spends()]
         for spend in offer.coin_spends():
-            matched, curried_args = match_dl_singleton(spend.puzzle_reveal)
+            matched, curried_args = _match_dl_singleton(spend.puzzle_reveal)
             if matched and spend.coin.name() not in all_parent_ids:
                 innerpuz, root_prg, launcher_id = curried_args
                 singleton_struct = launcher_to_struct(bytes32(launcher_id.as_python())).get_tree_hash()
@@ -1122,7 +1208,7 @@ class DataLayerWallet:
         for spend in offer.coin_spends():
             spend_to_add = spend
             solution = Program.from_serialized(spend.solution)
-            if match_dl_singleton(spend.puzzle_reveal)[0]:
+            if _match_dl_singleton(spend.puzzle_reveal)[0]:
                 try:
                     graftroot: Program = solution.at("rrffrf")
                 except EvalError:
@@ -1131,20 +1217,23 @@ class DataLayerWallet:
                 mod, curried_args_prg = graftroot.uncurry()
                 if mod == GRAFTROOT_DL_OFFERS:
                     _, singleton_structs, _, values_to_prove = curried_args_prg.as_iter()
+                    # Parse each proof's root and hash each struct once, outside the nested loops
+                    proofs_index: list[tuple[bytes32, tuple[int, list[bytes32]]]] = [
+                        (bytes32.from_hexstr(proof_of_inclusion[0]), (proof_of_inclusion[1], proof_of_inclusion[2]))
+                        for proof_of_inclusion in solver["proofs_of_inclusion"]
+                    ]
+                    struct_hashes: list[bytes32] = [struct.get_tree_hash() for struct in singleton_structs.as_iter()]
+                    values_list = values_to_prove.as_python()
                     all_proofs = []
                     roots = []
-                    for singleton, values in zip(singleton_structs.as_iter(), values_to_prove.as_python()):
-                        asserted_root: str | None = None
+                    for struct_hash, values in zip(struct_hashes, values_list):
+                        asserted_root: bytes32 | None = None
+                        expected_root: bytes32 = singleton_to_root[struct_hash]
                         proofs_of_inclusion = []
                         for value in values:
-                            for proof_of_inclusion in solver["proofs_of_inclusion"]:
-                                root: str = proof_of_inclusion[0]
-                                proof: tuple[int, list[bytes32]] = (proof_of_inclusion[1], proof_of_inclusion[2])
+                            for root, proof in proofs_index:
                                 calculated_root: bytes32 = _simplify_merkle_proof(value, proof)
-                                if (
-                                    calculated_root == bytes32.from_hexstr(root)
-                                    and calculated_root == singleton_to_root[singleton.get_tree_hash()]
-                                ):
+                                if calculated_root == root and calculated_root == expected_root:
                                     proofs_of_inclusion.append(proof)
                                     if asserted_root is None:
                                         asserted_root = root
@@ -1153,18 +1242,15 @@ class DataLayerWallet:
                                     break
                         roots.append(asserted_root)
                         all_proofs.append(proofs_of_inclusion)
-                    if sum(len(proofs) for proofs in all_proofs) < sum(1 for _ in values_to_prove.as_iter()):
+                    if sum(len(proofs) for proofs in all_proofs) < len(values_list):
                         raise ValueError("One or more proofs of inclusion were invalid")
                     new_solution: Program = solution.replace(
                         rrffrrf=Program.to(
                             [
                                 all_proofs,
-                                [Program.to((bytes32.from_hexstr(root), None)) for root in roots if root is not None],
-                                [ACS_MU_PH] * len(all_proofs),
-                                [
-                                    singleton_to_innerpuzhash[struct.get_tree_hash()]
-                                    for struct in singleton_structs.as_iter()
-                                ],
+                                [Program.to((root, None)) for root in roots if root is not None],
+                                _acs_mu_ph_list(len(all_proofs)),
+                                [singleton_to_innerpuzhash[struct_hash] for struct_hash in struct_hashes],
                                 solution.at("rrffrrfrrrrf"),
                             ]
                         )
@@ -1177,10 +1263,13 @@ class DataLayerWallet:
 
     @staticmethod
     async def get_offer_summary(offer: Offer) -> DataLayerSummary:
+        spends = list(offer.coin_spends())
+        # Index children by parent so each graftroot spend's child is a lookup, not a rescan
+        child_by_parent: dict[bytes32, CoinSpend] = {cs.coin.parent_coin_info: cs for cs in spends}
         singleton_summaries = []
-        for spend in offer.coin_spends():
+        for spend in spends:
             solution = Program.from_serialized(spend.solution)
-            matched, curried_args = match_dl_singleton(spend.puzzle_reveal)
+            matched, curried_args = _match_dl_singleton(spend.puzzle_reveal)
             if matched:
                 try:
                     graftroot: Program = solution.at("rrffrf")
@@ -1188,10 +1277,8 @@ class DataLayerWallet:
                     continue
                 mod, graftroot_curried_args = graftroot.uncurry()
                 if mod == GRAFTROOT_DL_OFFERS:
-                    child_spend: CoinSpend = next(
-                        cs for cs in offer.coin_spends() if cs.coin.parent_coin_info == spend.coin.name()
-                    )
-                    _, child_curried_args = match_dl_singleton(child_spend.puzzle_reveal)
+                    child_spend: CoinSpend = child_by_parent[spend.coin.name()]
+                    _, child_curried_args = _match_dl_singleton(child_spend.puzzle_reveal)
                     _, singleton_structs, _, values_to_prove = graftroot_curried_args.as_iter()
                     dependencies = []
                     for struct, values in zip(singleton_structs.as_iter(), values_to_prove.as_iter()):
@@ -1273,19 +1360,25 @@ def verify_offer(
         for store_proof in maker
     }
 
-    if maker_from_offer != maker_from_reference:
+    if maker_from_offer.keys() != maker_from_reference.keys():
         raise OfferIntegrityError("maker: offered stores and their roots do not match the reference data")
+    for store_id, root in maker_from_reference.items():
+        if maker_from_offer[store_id] != root:
+            raise OfferIntegrityError(
+                f"maker: offered stores and their roots do not match the reference data for store {store_id}"
+            )
 
     taker_from_offer = {
-        dependency.launcher_id: [bytes32(value) for value in dependency.values_to_prove]
+        dependency.launcher_id: tuple(bytes32(value) for value in dependency.values_to_prove)
         for offered in summary.offered
         for dependency in offered.dependencies
     }
 
-    taker_from_reference = {
-        store.store_id: [leaf_hash(key=inclusion.key, value=inclusion.value) for inclusion in store.inclusions]
-        for store in taker
-    }
-
-    if taker_from_offer != taker_from_reference:
+    if taker_from_offer.keys() != {store.store_id for store in taker}:
         raise OfferIntegrityError("taker: reference and offer inclusions do not match")
+    # Walk store by store so the leaf hashing stops at the first mismatch
+    for store in taker:
+        if taker_from_offer[store.store_id] != tuple(
+            leaf_hash(key=inclusion.key, value=inclusion.value) for inclusion in store.inclusions
+        ):
+            raise OfferIntegrityError(f"taker: reference and offer inclusions do not match for store {store.store_id}")
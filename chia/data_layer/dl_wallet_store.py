@@ -97,6 +97,12 @@ class DataLayerStore:
             await conn.execute(
                 "CREATE INDEX IF NOT EXISTS singleton_records_generation_index ON singleton_records(generation)"
             )
+            # Serves the per-launcher history queries, which filter on launcher_id and
+            # order by generation, without a separate sort step
+            await conn.execute(
+                "CREATE INDEX IF NOT EXISTS singleton_records_launcher_id_generation_index "
+                "ON singleton_records(launcher_id, generation DESC)"
+            )
 
             await conn.execute("CREATE TABLE IF NOT EXISTS launchers(id blob PRIMARY KEY, coin blob)")
 
@@ -129,6 +135,32 @@ class DataLayerStore:
                 ),
             )
 
+    async def add_singleton_records(self, records: list[SingletonRecord]) -> None:
+        """
+        Store multiple SingletonRecords in one statement.
+        """
+        if len(records) == 0:
+            return
+
+        async with self.db_wrapper.writer_maybe_transaction() as conn:
+            await conn.executemany(
+                "INSERT OR REPLACE INTO singleton_records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        record.coin_id,
+                        record.launcher_id,
+                        record.root,
+                        record.inner_puzzle_hash,
+                        int(record.confirmed),
+                        record.confirmed_at_height,
+                        bytes(record.lineage_proof),
+                        record.generation,
+                        record.timestamp,
+                    )
+                    for record in records
+                ],
+            )
+
     async def get_all_singletons_for_launcher(
         self,
         launcher_id: bytes32,
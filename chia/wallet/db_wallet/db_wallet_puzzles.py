@@ -87,11 +87,15 @@ def create_graftroot_offer_puz(
     )
 
 
+# The mirror puzzle is static, so curry and hash it once rather than per call
+_MIRROR_PUZZLE = P2_PARENT.curry(Program.to(1))
+
+
 def create_mirror_puzzle() -> Program:
-    return P2_PARENT.curry(Program.to(1))
+    return _MIRROR_PUZZLE
 
 
-MIRROR_PUZZLE_HASH = create_mirror_puzzle().get_tree_hash()
+MIRROR_PUZZLE_HASH = _MIRROR_PUZZLE.get_tree_hash()
 
 
 def get_mirror_info(
@@ -102,7 +106,7 @@ def get_mirror_info(
     for condition in conditions.as_iter():
         if (
             condition.first().as_python() == ConditionOpcode.CREATE_COIN
-            and condition.at("rf").as_python() == create_mirror_puzzle().get_tree_hash()
+            and condition.at("rf").as_python() == MIRROR_PUZZLE_HASH
         ):
             memos: list[bytes] = condition.at("rrrf").as_python()
             launcher_id = bytes32(memos[0])
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 import time
 import traceback
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from chia_rs import CoinSpend, G1Element, G2Element
@@ -21,6 +22,7 @@ from chia.wallet.cat_wallet.cat_utils import CAT_MOD_HASH, CAT_MOD_HASH_HASH, co
 from chia.wallet.cat_wallet.cat_wallet import CATWallet
 from chia.wallet.coin_selection import select_coins
 from chia.wallet.conditions import (
+    AssertCoinAnnouncement,
     Condition,
     ConditionValidTimes,
     CreateCoin,
@@ -678,6 +680,23 @@ class CRCATWallet(CATWallet):
         reuse_puzhash: bool | None = None,
         extra_conditions: tuple[Condition, ...] = tuple(),
     ) -> None:
+        await CRCATWallet.claim_pending_approval_balances(
+            [(self, min_amount_to_claim)],
+            action_scope,
+            fee=fee,
+            coins=coins,
+            max_coin_amount=max_coin_amount,
+            extra_conditions=extra_conditions,
+        )
+
+    async def _generate_pending_approval_spend(
+        self,
+        min_amount_to_claim: uint64,
+        action_scope: WalletActionScope,
+        vc: VerifiedCredential,
+        coins: set[Coin] | None = None,
+        max_coin_amount: uint64 | None = None,
+    ) -> tuple[WalletSpendBundle, set[Coin], list[AssertCoinAnnouncement], list[Condition]]:
         # Select the relevant CR-CAT coins
         crcat_records: set[WalletCoinRecord] = await self.wallet_state_manager.coin_store.get_unspent_coins_for_wallet(
             self.id(), CoinType.CRCAT_PENDING
@@ -694,31 +713,16 @@ class CRCATWallet(CATWallet):
                 uint128(min_amount_to_claim),
             )
 
-        # Select the relevant XCH coins
-        if fee > 0:
-            chia_coins = await self.standard_wallet.select_coins(
-                fee,
-                action_scope,
-            )
-        else:
-            chia_coins = set()
-
-        # Select the relevant VC coin
-        vc_wallet: VCWallet = await self.wallet_state_manager.get_or_create_vc_wallet()
-        vc: VerifiedCredential | None = await vc_wallet.get_vc_with_provider_in_and_proofs(
-            self.info.authorized_providers, self.info.proofs_checker.flags
-        )
-        if vc is None:  # pragma: no cover
-            raise RuntimeError(f"No VC exists that can approve spends for CR-CAT wallet {self.id()}")
         if vc.proof_hash is None:
             raise RuntimeError(f"VC {vc.launcher_id} has no proofs to authorize transaction")  # pragma: no cover
+        vc_wallet: VCWallet = await self.wallet_state_manager.get_or_create_vc_wallet()
         proof_of_inclusions: Program = await vc_wallet.proof_of_inclusions_for_root_and_keys(
             vc.proof_hash, self.info.proofs_checker.flags
         )
 
         # Generate the bundle nonce
         nonce: bytes32 = Program.to(
-            [coin_as_list(c) for c in sorted(coins.union(chia_coins).union({vc.coin}), key=Coin.name)]
+            [coin_as_list(c) for c in sorted(coins.union({vc.coin}), key=Coin.name)]
         ).get_tree_hash()
 
         # Make CR-CAT bundle
@@ -745,55 +749,119 @@ class CRCATWallet(CATWallet):
         )
         claim_bundle = WalletSpendBundle(coin_spends, G2Element())
 
+        vc_conditions: list[Condition] = [
+            *expected_announcements,
+            CreateCoinAnnouncement(nonce),
+            *(CreatePuzzleAnnouncement(crcat.expected_announcement()) for crcat, _ in crcats_and_puzhashes),
+        ]
+
+        return claim_bundle, coins, expected_announcements, vc_conditions
+
+    @classmethod
+    async def claim_pending_approval_balances(
+        cls,
+        claims: Sequence[tuple[CRCATWallet, uint64]],  # wallet, min_amount_to_claim
+        action_scope: WalletActionScope,
+        fee: uint64 = uint64(0),
+        coins: set[Coin] | None = None,
+        max_coin_amount: uint64 | None = None,
+        extra_conditions: tuple[Condition, ...] = tuple(),
+    ) -> None:
+        """
+        Claim the "pending approval" balances of one or more CR-CAT wallets with a single spend of the approving VC.
+
+        All of the wallets must be approvable by the same VC since only one VC spend is made for the whole batch.
+        """
+        if len(claims) == 0:
+            raise ValueError("Must specify at least one CR-CAT wallet to claim a pending approval balance from")
+        if coins is not None and len(claims) > 1:
+            raise ValueError("Cannot specify a manual coin selection when claiming for multiple CR-CAT wallets")
+
+        wallet_state_manager = claims[0][0].wallet_state_manager
+
+        # Select the relevant VC coin
+        vc_wallet: VCWallet = await wallet_state_manager.get_or_create_vc_wallet()
+        vc: VerifiedCredential | None = None
+        for wallet, _ in claims:
+            wallet_vc: VerifiedCredential | None = await vc_wallet.get_vc_with_provider_in_and_proofs(
+                wallet.info.authorized_providers, wallet.info.proofs_checker.flags
+            )
+            if wallet_vc is None:  # pragma: no cover
+                raise RuntimeError(f"No VC exists that can approve spends for CR-CAT wallet {wallet.id()}")
+            if vc is None:
+                vc = wallet_vc
+            elif vc.launcher_id != wallet_vc.launcher_id:
+                raise ValueError("Cannot claim pending approval balances of wallets approved by different VCs")
+        assert vc is not None
+
+        # Make the CR-CAT bundles
+        claim_info: list[tuple[CRCATWallet, WalletSpendBundle, set[Coin]]] = []
+        all_expected_announcements: list[AssertCoinAnnouncement] = []
+        all_vc_conditions: list[Condition] = []
+        for wallet, min_amount_to_claim in claims:
+            claim_bundle, claimed_coins, expected_announcements, vc_conditions = (
+                await wallet._generate_pending_approval_spend(
+                    min_amount_to_claim,
+                    action_scope,
+                    vc,
+                    coins=coins,
+                    max_coin_amount=max_coin_amount,
+                )
+            )
+            claim_info.append((wallet, claim_bundle, claimed_coins))
+            all_expected_announcements.extend(expected_announcements)
+            all_vc_conditions.extend(vc_conditions)
+
         # Make the Fee TX
         if fee > 0:
-            await self.create_tandem_xch_tx(
+            await claims[0][0].create_tandem_xch_tx(
                 fee,
                 uint64(0),
                 action_scope,
-                extra_conditions=tuple(expected_announcements),
+                extra_conditions=tuple(all_expected_announcements),
             )
 
         # Make the VC TX
         await vc_wallet.generate_signed_transaction(
             [uint64(1)],
-            [await action_scope.get_puzzle_hash(self.wallet_state_manager)],
+            [await action_scope.get_puzzle_hash(wallet_state_manager)],
             action_scope,
             vc_id=vc.launcher_id,
             extra_conditions=(
                 *extra_conditions,
-                *expected_announcements,
-                CreateCoinAnnouncement(nonce),
-                *(CreatePuzzleAnnouncement(crcat.expected_announcement()) for crcat, _ in crcats_and_puzhashes),
+                *all_vc_conditions,
             ),
         )
 
-        to_puzzle_hash = await action_scope.get_puzzle_hash(self.wallet_state_manager, override_reuse_puzhash_with=True)
+        to_puzzle_hash = await action_scope.get_puzzle_hash(wallet_state_manager, override_reuse_puzhash_with=True)
         async with action_scope.use() as interface:
             other_additions: set[Coin] = {rem for tx in interface.side_effects.transactions for rem in tx.additions}
             other_removals: set[Coin] = {rem for tx in interface.side_effects.transactions for rem in tx.removals}
-            interface.side_effects.transactions.append(
-                TransactionRecord(
-                    confirmed_at_height=uint32(0),
-                    created_at_time=uint64(time.time()),
-                    to_puzzle_hash=to_puzzle_hash,
-                    to_address=self.wallet_state_manager.encode_puzzle_hash(to_puzzle_hash),
-                    amount=uint64(sum(c.amount for c in coins)),
-                    fee_amount=fee,
-                    confirmed=False,
-                    sent=uint32(0),
-                    spend_bundle=claim_bundle,
-                    additions=list(set(claim_bundle.additions()) - other_additions),
-                    removals=list(set(claim_bundle.removals()) - other_removals),
-                    wallet_id=self.id(),
-                    sent_to=[],
-                    trade_id=None,
-                    type=uint32(TransactionType.INCOMING_TX.value),
-                    name=claim_bundle.name(),
-                    memos=compute_memos(claim_bundle),
-                    valid_times=parse_timelock_info(extra_conditions),
+            for wallet, claim_bundle, claimed_coins in claim_info:
+                interface.side_effects.transactions.append(
+                    TransactionRecord(
+                        confirmed_at_height=uint32(0),
+                        created_at_time=uint64(time.time()),
+                        to_puzzle_hash=to_puzzle_hash,
+                        to_address=wallet_state_manager.encode_puzzle_hash(to_puzzle_hash),
+                        amount=uint64(sum(c.amount for c in claimed_coins)),
+                        fee_amount=fee,
+                        confirmed=False,
+                        sent=uint32(0),
+                        spend_bundle=claim_bundle,
+                        additions=list(set(claim_bundle.additions()) - other_additions),
+                        removals=list(set(claim_bundle.removals()) - other_removals),
+                        wallet_id=wallet.id(),
+                        sent_to=[],
+                        trade_id=None,
+                        type=uint32(TransactionType.INCOMING_TX.value),
+                        name=claim_bundle.name(),
+                        memos=compute_memos(claim_bundle),
+                        valid_times=parse_timelock_info(extra_conditions),
+                    )
                 )
-            )
+                other_additions.update(claim_bundle.additions())
+                other_removals.update(claim_bundle.removals())
 
     async def match_puzzle_info(self, puzzle_driver: PuzzleInfo) -> bool:
         if (
@@ -2596,6 +2596,25 @@ class CRCATApprovePendingResponse(TransactionEndpointResponse):
     pass
 
 
+@streamable
+@dataclass(kw_only=True, frozen=True)
+class CRCATApproval(Streamable):
+    wallet_id: uint32
+    min_amount_to_claim: uint64
+
+
+@streamable
+@dataclass(kw_only=True, frozen=True)
+class CRCATApprovePendingBulk(TransactionEndpointRequest):
+    approvals: list[CRCATApproval]
+
+
+@streamable
+@dataclass(kw_only=True, frozen=True)
+class CRCATApprovePendingBulkResponse(TransactionEndpointResponse):
+    pass
+
+
 @streamable
 @dataclass(kw_only=True, frozen=True)
 class GetFarmedAmount(Streamable):
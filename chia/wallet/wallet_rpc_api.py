@@ -117,6 +117,8 @@ from chia.wallet.wallet_request_types import (
     CombineCoins,
     CombineCoinsResponse,
     CRCATApprovePending,
+    CRCATApprovePendingBulk,
+    CRCATApprovePendingBulkResponse,
     CRCATApprovePendingResponse,
     CreateNewDL,
     CreateNewDLResponse,
@@ -713,6 +715,7 @@ class WalletRpcApi:
             "/vc_revoke": self.vc_revoke,
             # CR-CATs
             "/crcat_approve_pending": self.crcat_approve_pending,
+            "/crcat_approve_pending_bulk": self.crcat_approve_pending_bulk,
             # Signer Protocol
             "/gather_signing_info": self.gather_signing_info,
             "/apply_signatures": self.apply_signatures,
@@ -3706,6 +3709,38 @@ class WalletRpcApi:
         # tx_endpoint will take care of default values here
         return CRCATApprovePendingResponse(unsigned_transactions=[], transactions=[])
 
+    @tx_endpoint(push=True)
+    @marshal
+    async def crcat_approve_pending_bulk(
+        self,
+        request: CRCATApprovePendingBulk,
+        action_scope: WalletActionScope,
+        extra_conditions: tuple[Condition, ...] = tuple(),
+    ) -> CRCATApprovePendingBulkResponse:
+        """
+        Moving the "pending approval" CR-CATs of multiple wallets into their spendable balances with a single VC spend
+        :param request: Required 'approvals', a list of 'wallet_id' + 'min_amount_to_claim' pairs.
+        Standard transaction params 'fee' & 'reuse_puzhash'.
+        :return: a list of all relevant 'transactions' (TransactionRecord) that this spend generates:
+        (CRCAT TXs + fee TX)
+        """
+
+        claims: list[tuple[CRCATWallet, uint64]] = []
+        for approval in request.approvals:
+            cr_cat_wallet = self.service.wallet_state_manager.wallets[approval.wallet_id]
+            assert isinstance(cr_cat_wallet, CRCATWallet)
+            claims.append((cr_cat_wallet, approval.min_amount_to_claim))
+
+        await CRCATWallet.claim_pending_approval_balances(
+            claims,
+            action_scope,
+            fee=request.fee,
+            extra_conditions=extra_conditions,
+        )
+
+        # tx_endpoint will take care of default values here
+        return CRCATApprovePendingBulkResponse(unsigned_transactions=[], transactions=[])
+
     @marshal
     async def gather_signing_info(
         self,
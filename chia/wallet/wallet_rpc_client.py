@@ -36,6 +36,8 @@ from chia.wallet.wallet_request_types import (
     CombineCoins,
     CombineCoinsResponse,
     CRCATApprovePending,
+    CRCATApprovePendingBulk,
+    CRCATApprovePendingBulkResponse,
     CRCATApprovePendingResponse,
     CreateNewDL,
     CreateNewDLResponse,
@@ -976,6 +978,20 @@ class WalletRpcClient(RpcClient):
             )
         )
 
+    async def crcat_approve_pending_bulk(
+        self,
+        request: CRCATApprovePendingBulk,
+        tx_config: TXConfig,
+        extra_conditions: tuple[Condition, ...] = tuple(),
+        timelock_info: ConditionValidTimes = ConditionValidTimes(),
+    ) -> CRCATApprovePendingBulkResponse:
+        return CRCATApprovePendingBulkResponse.from_json_dict(
+            await self.fetch(
+                "crcat_approve_pending_bulk",
+                request.json_serialize_for_transport(tx_config, extra_conditions, timelock_info),
+            )
+        )
+
     async def gather_signing_info(
         self,
         args: GatherSigningInfo,
@@ -2463,8 +2463,7 @@ class WalletStateManager:
                     all_coins_names.extend([coin.name() for coin in tx_record.additions])
                     all_coins_names.extend([coin.name() for coin in tx_record.removals])
 
-                for singleton_record in singleton_records:
-                    await self.dl_store.add_singleton_record(singleton_record)
+                await self.dl_store.add_singleton_records(singleton_records)
 
                 if plotnft_exiting_info is not None:
                     await self.plotnft2_store.add_exiting_info(exiting_info=plotnft_exiting_info)